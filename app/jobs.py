@@ -1,14 +1,34 @@
 import os
-import json
 import sys
+import time
+import fcntl
+import select
+import signal
+import atexit
+import queue
+import itertools
 import threading
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from typing import Any
+
+import orjson
+
+
+# (epoch second, formatted) - status bursts within the same second reuse the string
+_now_iso_cache: tuple[int, str] = (0, "")
 
 
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    global _now_iso_cache
+    sec = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] != sec:
+        cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)))
+        _now_iso_cache = cached
+    return cached[1]
 
 
 def _data_dir() -> Path:
@@ -19,17 +39,153 @@ def job_dir(job_id: str) -> Path:
     return _data_dir() / "jobs" / job_id
 
 
+# Per-job caches are LRUs of this many recent jobs, so a long-lived worker stays bounded
+_JOB_CACHE_MAX = 1024
+
+
+def _lru_put(cache: "OrderedDict[str, Any]", job_id: str, value: Any) -> None:
+    # Caller holds the cache's lock
+    cache[job_id] = value
+    cache.move_to_end(job_id)
+    if len(cache) > _JOB_CACHE_MAX:
+        cache.popitem(last=False)
+
+
+_JOB_SUBDIRS = ("inputs", "out", "manifests")
+# Job folders this process has recently laid out, so repeat calls skip the mkdir syscalls.
+# Writers that hit FileNotFoundError re-create the folders with refresh=True, in case a
+# job directory was removed behind our back.
+_KNOWN_JOB_DIRS: "OrderedDict[str, None]" = OrderedDict()
+_KNOWN_JOB_DIRS_LOCK = threading.Lock()
+
+
+def ensure_job_dirs(job_id: str, refresh: bool = False) -> Path:
+    """
+    Create the job folder skeleton (inputs/, out/, manifests/), skipping it for recently seen jobs.
+    """
+    jdir = job_dir(job_id)
+    with _KNOWN_JOB_DIRS_LOCK:
+        known = not refresh and job_id in _KNOWN_JOB_DIRS
+        if known:
+            _KNOWN_JOB_DIRS.move_to_end(job_id)
+    if not known:
+        for sub in _JOB_SUBDIRS:
+            (jdir / sub).mkdir(parents=True, exist_ok=True)
+        with _KNOWN_JOB_DIRS_LOCK:
+            _lru_put(_KNOWN_JOB_DIRS, job_id, None)
+    return jdir
+
+
+def _write_job_file(job_id: str, path: Path, body: bytes) -> None:
+    try:
+        path.write_bytes(body)
+    except FileNotFoundError:
+        ensure_job_dirs(job_id, refresh=True)
+        path.write_bytes(body)
+
+
 def _status_path(job_id: str) -> Path:
     return job_dir(job_id) / "status.json"
 
 
-def _write_status(job_id: str, status: str, extra: dict | None = None) -> None:
+# status.json per recently polled/written job (LRU), keyed on the file's (mtime_ns, size)
+# so polls only pay for a stat() until the file changes: job_id -> (key, raw bytes)
+_STATUS_CACHE: "OrderedDict[str, tuple[tuple[int, int], bytes]]" = OrderedDict()
+# Updates handed to the writer thread but not yet on disk: job_id -> raw bytes
+_PENDING_STATUS: dict[str, bytes] = {}
+_STATUS_CACHE_LOCK = threading.Lock()
+# Updates are numbered as they are made; a job's status.json is only ever replaced by a
+# newer update, so a queued write that lands after a synchronous one cannot undo it.
+# Only the last few jobs' numbers matter (the writer queue drains within moments), so the
+# stored numbers share the per-job LRU bound.
+_STATUS_SEQ = itertools.count(1)
+_STORED_SEQ: "OrderedDict[str, int]" = OrderedDict()
+_STATUS_WRITE_LOCK = threading.Lock()
+_STATUS_Q: "queue.Queue[tuple[str, int, bytes]]" = queue.Queue()
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int]:
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _store_status(job_id: str, seq: int, body: bytes) -> None:
+    with _STATUS_WRITE_LOCK:
+        if seq < _STORED_SEQ.get(job_id, 0):
+            return
+        ensure_job_dirs(job_id)
+        sp = _status_path(job_id)
+        # Write-then-rename so readers (possibly in another worker) never observe a truncated file
+        tmp = sp.with_suffix(".json.tmp")
+        _write_job_file(job_id, tmp, body)
+        os.replace(tmp, sp)
+        _lru_put(_STORED_SEQ, job_id, seq)
+        # Seed the cache so the next poll doesn't re-read what we just wrote
+        with _STATUS_CACHE_LOCK:
+            _lru_put(_STATUS_CACHE, job_id, (_stat_key(sp.stat()), body))
+            if _PENDING_STATUS.get(job_id) is body:
+                del _PENDING_STATUS[job_id]
+
+
+def _status_writer() -> None:
+    """
+    Drain queued status updates, writing only the newest update per job in each batch.
+    """
+    while True:
+        batch = [_STATUS_Q.get()]
+        while True:
+            try:
+                batch.append(_STATUS_Q.get_nowait())
+            except queue.Empty:
+                break
+        latest = {job_id: (seq, body) for job_id, seq, body in batch}
+        for job_id, (seq, body) in latest.items():
+            try:
+                _store_status(job_id, seq, body)
+            except Exception as ex:
+                print(f"[jobs] failed to write status for {job_id}: {ex}", file=sys.stderr)
+        for _ in batch:
+            _STATUS_Q.task_done()
+
+
+threading.Thread(target=_status_writer, name="vpg-status-writer", daemon=True).start()
+# Make sure final transitions (completed/failed) reach disk before the process exits
+atexit.register(_STATUS_Q.join)
+
+
+def _write_status(job_id: str, status: str, extra: dict | None = None, wait: bool = False) -> None:
+    """
+    Record a status transition. Writes go through the background writer unless wait=True,
+    which writes synchronously (used for the first status so other workers can see the job).
+    """
     payload = {"jobId": job_id, "status": status, "updatedAt": _now_iso()}
     if extra:
         payload.update(extra)
-    sp = _status_path(job_id)
-    sp.parent.mkdir(parents=True, exist_ok=True)
-    sp.write_text(json.dumps(payload))
+    body = orjson.dumps(payload)
+    with _STATUS_CACHE_LOCK:
+        seq = next(_STATUS_SEQ)
+        _PENDING_STATUS[job_id] = body
+    if wait:
+        _store_status(job_id, seq, body)
+    else:
+        _STATUS_Q.put((job_id, seq, body))
+
+
+# Parsed default orchestrator config, re-read only when the file changes: (stat key, dict)
+_DEFAULT_CFG_CACHE: tuple[tuple[int, int], dict] | None = None
+
+
+def _default_config(path: Path) -> dict:
+    global _DEFAULT_CFG_CACHE
+    try:
+        key = _stat_key(path.stat())
+    except FileNotFoundError:
+        raise RuntimeError(f"Missing default config: {path}")
+    cached = _DEFAULT_CFG_CACHE
+    if cached is None or cached[0] != key:
+        cached = (key, orjson.loads(path.read_bytes()))
+        _DEFAULT_CFG_CACHE = cached
+    # Per-job overrides only replace top-level keys, so a shallow copy keeps the cache intact
+    return dict(cached[1])
 
 
 def _build_job_config(job_id: str) -> Path:
@@ -37,17 +193,12 @@ def _build_job_config(job_id: str) -> Path:
     Create a per-job config overriding input/output paths into the job folder.
     """
     project_root = Path(__file__).resolve().parents[1]
-    default_cfg_path = project_root / "run_full_video_creation_sequence.config.json"
-    if not default_cfg_path.exists():
-        raise RuntimeError(f"Missing default config: {default_cfg_path}")
-    cfg = json.loads(default_cfg_path.read_text())
+    cfg = _default_config(project_root / "run_full_video_creation_sequence.config.json")
 
-    jdir = job_dir(job_id)
+    jdir = ensure_job_dirs(job_id)
     inputs = jdir / "inputs"
     outputs = jdir / "out"
     manifests = jdir / "manifests"
-    outputs.mkdir(parents=True, exist_ok=True)
-    manifests.mkdir(parents=True, exist_ok=True)
 
     # Override key paths to be job-scoped
     cfg["generator_inputs_json"] = str(inputs / "generator_inputs.json")
@@ -73,10 +224,70 @@ def _build_job_config(job_id: str) -> Path:
         cfg["skip_configure_roles"] = True
 
     job_cfg_path = jdir / "run.config.json"
-    job_cfg_path.write_text(json.dumps(cfg))
+    _write_job_file(job_id, job_cfg_path, orjson.dumps(cfg))
     return job_cfg_path
 
 
+_LOG_BUFFER_SIZE = 16 * 1024
+_LOG_READ_SIZE = 64 * 1024
+_LOG_PIPE_SIZE = 1 << 20
+_LOG_POLL_SEC = 0.5
+
+
+def _copy_output_to_log(proc: subprocess.Popen, logf) -> None:
+    """
+    Copy the child's stdout pipe into the (buffered) job log until the orchestrator exits.
+    Stray Blender/ffmpeg descendants can keep the pipe open after that, so the copy stops
+    once the orchestrator is gone and whatever is already in the pipe has been drained,
+    rather than at EOF.
+    """
+    out = proc.stdout
+    fd = out.fileno()
+    # Linux only: a larger pipe lets chatty children (ffmpeg/Blender) run ahead of us
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, _LOG_PIPE_SIZE)
+        except OSError:
+            pass
+    os.set_blocking(fd, False)
+    try:
+        while proc.poll() is None:
+            ready, _, _ = select.select([fd], [], [], _LOG_POLL_SEC)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(fd, _LOG_READ_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                return
+            logf.write(chunk)
+        # Orchestrator exited: take what is buffered now, at most one pipe's worth
+        drained = 0
+        while drained < _LOG_PIPE_SIZE:
+            try:
+                chunk = os.read(fd, _LOG_READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            logf.write(chunk)
+            drained += len(chunk)
+    finally:
+        out.close()
+
+
+# Job bookkeeping for queue positions and shutdown. Ids move _WAITING -> _ACTIVE while a
+# worker handles them; _RUNNING holds the orchestrator process once it is spawned.
+_JOBS_LOCK = threading.Lock()
+_WAITING: set[str] = set()
+_ACTIVE: set[str] = set()
+_RUNNING: dict[str, subprocess.Popen] = {}
+# Jobs stopped by drain_jobs(); their worker must not overwrite the "interrupted" status
+_INTERRUPTED: set[str] = set()
+_DRAIN_TIMEOUT_SEC = 5.0
+
+
 def _run_orchestrator(job_id: str) -> None:
     project_root = Path(__file__).resolve().parents[1]
     jdir = job_dir(job_id)
@@ -97,11 +308,30 @@ def _run_orchestrator(job_id: str) -> None:
     env["PYTHONUNBUFFERED"] = "1"
 
     _write_status(job_id, "running", {"cmd": cmd})
-    with open(log_path, "ab", buffering=0) as logf:
+    # Child output goes through a pipe into a buffered sink: the log file sees a few
+    # large writes instead of one write() per line the child prints.
+    with open(log_path, "ab", buffering=_LOG_BUFFER_SIZE) as logf:
         logf.write(f"[start] {' '.join(cmd)}\n".encode())
         try:
-            proc = subprocess.Popen(cmd, cwd=str(project_root), env=env, stdout=logf, stderr=subprocess.STDOUT)
-            rc = proc.wait()
+            with _JOBS_LOCK:
+                if job_id in _INTERRUPTED:
+                    return
+                # Own process group, so shutdown can signal Blender/ffmpeg grandchildren too
+                proc = subprocess.Popen(
+                    cmd, cwd=str(project_root), env=env,
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+                    start_new_session=True,
+                )
+                _RUNNING[job_id] = proc
+            try:
+                _copy_output_to_log(proc, logf)
+                rc = proc.wait()
+            finally:
+                with _JOBS_LOCK:
+                    _RUNNING.pop(job_id, None)
+                    interrupted = job_id in _INTERRUPTED
+            if interrupted:
+                return
             if rc == 0:
                 out_mp4 = jdir / "out" / "blender_render.mp4"
                 _write_status(job_id, "completed", {"output": str(out_mp4)})
@@ -111,21 +341,225 @@ def _run_orchestrator(job_id: str) -> None:
             _write_status(job_id, "failed", {"error": str(ex)})
 
 
+# Server-wide job limit, shared by every gunicorn worker through lock files under the data dir:
+# a running job holds an exclusive flock on one job_slots/slot<i>.lock, a queued job a shared
+# flock on job_queue/<job_id>. flock locks go away with their process, so a crashed worker
+# never leaks a slot and its leftover queue files are recognisable as stale.
+_MAX_CONCURRENT_JOBS = max(1, int(os.environ.get("VPG_MAX_CONCURRENT_JOBS", "2")))
+_SLOT_POLL_SEC = 0.5
+# One waiter per process polls for a slot at a time, so this process's jobs start in queue order
+_SLOT_WAIT_LOCK = threading.Lock()
+# A process can never hold more than _MAX_CONCURRENT_JOBS slots, so that many threads suffice
+_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_JOBS, thread_name_prefix="vpg-job")
+atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+# Queue files this process holds open (and shared-locked), by job id
+_QUEUE_FDS: dict[str, int] = {}
+
+
+def _slots_dir() -> Path:
+    return _data_dir() / "job_slots"
+
+
+def _queue_dir() -> Path:
+    return _data_dir() / "job_queue"
+
+
+def _try_flock(path: Path, op: int, create: bool = True) -> int | None:
+    """
+    Open path and take a non-blocking flock on it; returns the fd, or None if the lock is held
+    elsewhere (or, with create=False, the file is gone).
+    """
+    try:
+        fd = os.open(path, os.O_RDWR | (os.O_CREAT if create else 0), 0o644)
+    except FileNotFoundError:
+        return None
+    try:
+        fcntl.flock(fd, op | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _busy_slots() -> int:
+    busy = 0
+    for i in range(_MAX_CONCURRENT_JOBS):
+        fd = _try_flock(_slots_dir() / f"slot{i}.lock", fcntl.LOCK_EX)
+        if fd is None:
+            busy += 1
+        else:
+            os.close(fd)
+    return busy
+
+
+def _queued_jobs() -> int:
+    """
+    Count jobs waiting for a slot in any worker, removing entries left by dead processes.
+    """
+    waiting = 0
+    for entry in _queue_dir().iterdir():
+        if entry.name.startswith("."):
+            continue
+        fd = _try_flock(entry, fcntl.LOCK_EX, create=False)
+        if fd is None:
+            waiting += 1
+            continue
+        try:
+            entry.unlink(missing_ok=True)
+        finally:
+            os.close(fd)
+    return waiting
+
+
+def _enqueue(job_id: str) -> int:
+    """
+    Register job_id as waiting and return how many jobs are ahead of it server-wide
+    once every slot is taken (0 = starts immediately).
+    """
+    qdir = _queue_dir()
+    qdir.mkdir(parents=True, exist_ok=True)
+    _slots_dir().mkdir(parents=True, exist_ok=True)
+    # Serialize count + register across workers so concurrent submits get distinct positions
+    guard = os.open(qdir / ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(guard, fcntl.LOCK_EX)
+        position = max(0, _queued_jobs() + _busy_slots() - _MAX_CONCURRENT_JOBS + 1)
+        # Lock before the file becomes visible, so no other worker can take it for stale
+        tmp = qdir / f".{job_id}.tmp"
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        os.replace(tmp, qdir / job_id)
+    finally:
+        os.close(guard)
+    with _JOBS_LOCK:
+        _QUEUE_FDS[job_id] = fd
+    return position
+
+
+def _dequeue(job_id: str) -> None:
+    # Caller holds _JOBS_LOCK
+    fd = _QUEUE_FDS.pop(job_id, None)
+    if fd is None:
+        return
+    try:
+        (_queue_dir() / job_id).unlink(missing_ok=True)
+    finally:
+        os.close(fd)
+
+
+def _acquire_slot(job_id: str) -> int | None:
+    """
+    Wait for a free server-wide job slot; returns its locked fd, or None if the job
+    was interrupted while waiting.
+    """
+    with _SLOT_WAIT_LOCK:
+        while True:
+            with _JOBS_LOCK:
+                if job_id in _INTERRUPTED:
+                    return None
+            for i in range(_MAX_CONCURRENT_JOBS):
+                fd = _try_flock(_slots_dir() / f"slot{i}.lock", fcntl.LOCK_EX)
+                if fd is not None:
+                    return fd
+            time.sleep(_SLOT_POLL_SEC)
+
+
+def _run_queued(job_id: str) -> None:
+    slot = _acquire_slot(job_id)
+    with _JOBS_LOCK:
+        _WAITING.discard(job_id)
+        _dequeue(job_id)
+        if slot is None or job_id in _INTERRUPTED:
+            if slot is not None:
+                os.close(slot)
+            return
+        _ACTIVE.add(job_id)
+    try:
+        _run_orchestrator(job_id)
+    finally:
+        with _JOBS_LOCK:
+            _ACTIVE.discard(job_id)
+        os.close(slot)
+
+
 def start_job(job_id: str) -> None:
     """
-    Spawn a background thread to run the orchestrator for this job.
+    Queue the orchestrator run for this job; it starts once a server-wide job slot is free.
+    """
+    position = _enqueue(job_id)
+    with _JOBS_LOCK:
+        _WAITING.add(job_id)
+    _write_status(job_id, "queued", {"queuePosition": position}, wait=True)
+    _EXECUTOR.submit(_run_queued, job_id)
+
+
+def _signal_job_group(proc: subprocess.Popen, sig: int) -> None:
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def drain_jobs() -> None:
+    """
+    Stop this process's jobs on shutdown: drop queued ones, terminate running orchestrators
+    (kill after a grace period) and mark all of them "interrupted".
+    Called from gunicorn's worker_exit hook and the dev server's SIGTERM handler.
     """
-    t = threading.Thread(target=_run_orchestrator, args=(job_id,), daemon=True)
-    t.start()
+    _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    with _JOBS_LOCK:
+        job_ids = _WAITING | _ACTIVE
+        _INTERRUPTED.update(job_ids)
+        # Queued jobs cancelled with the executor never reach _run_queued to dequeue themselves
+        for job_id in list(_QUEUE_FDS):
+            _dequeue(job_id)
+        procs = list(_RUNNING.values())
+    for proc in procs:
+        _signal_job_group(proc, signal.SIGTERM)
+    deadline = time.monotonic() + _DRAIN_TIMEOUT_SEC
+    for proc in procs:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _signal_job_group(proc, signal.SIGKILL)
+    for job_id in job_ids:
+        _write_status(job_id, "interrupted", wait=True)
 
 
-def read_status(job_id: str) -> dict:
+def _cached_status(job_id: str) -> bytes | None:
+    """
+    Raw bytes of the job's status.json on disk, re-read only when the file changed.
+    """
     sp = _status_path(job_id)
-    if not sp.exists():
-        return {"jobId": job_id, "status": "unknown"}
     try:
-        return json.loads(sp.read_text())
-    except Exception:
-        return {"jobId": job_id, "status": "unknown"}
+        key = _stat_key(sp.stat())
+    except OSError:
+        return None
+    with _STATUS_CACHE_LOCK:
+        hit = _STATUS_CACHE.get(job_id)
+        if hit:
+            _STATUS_CACHE.move_to_end(job_id)
+    if hit and hit[0] == key:
+        return hit[1]
+    try:
+        raw = sp.read_bytes()
+    except OSError:
+        return None
+    # Writes are atomic (temp file + rename), so a shape check stands in for a full parse
+    if not raw.startswith(b"{"):
+        return None
+    with _STATUS_CACHE_LOCK:
+        _lru_put(_STATUS_CACHE, job_id, (key, raw))
+    return raw
 
 
+def read_status_bytes(job_id: str) -> bytes | None:
+    """
+    Serialized status.json for the job (None if missing or unreadable), served as-is
+    so status polls skip the parse + re-encode round trip.
+    """
+    with _STATUS_CACHE_LOCK:
+        pending = _PENDING_STATUS.get(job_id)
+    if pending:
+        return pending
+    return _cached_status(job_id)
@@ -1,44 +1,67 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from pathlib import Path
-import os, json, uuid
+import os, re, shutil, signal, sys, uuid
+import orjson
+
+from .jobs import drain_jobs, ensure_job_dirs, read_status_bytes, start_job
 
 app = Flask(__name__)
+# Reject oversized uploads up front (script + generator inputs are small text files)
+app.config["MAX_CONTENT_LENGTH"] = int(os.environ.get("VPG_MAX_UPLOAD_MB", "64")) * 1024 * 1024
+
+UPLOAD_COPY_CHUNK = 1 << 20
+# New ids are uuid4().hex; the hyphenated form is still accepted for jobs created before
+JOB_ID_RE = re.compile(r"[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
 
 DATA_DIR = Path(os.environ.get("VPG_DATA_DIR", "./data")).resolve()
 (DATA_DIR / "jobs").mkdir(parents=True, exist_ok=True)
 
-def job_dir(job_id: str) -> Path:
-    return DATA_DIR / "jobs" / job_id
+def json_response(obj, status: int = 200) -> Response:
+    # Serialize with orjson (C encoder) rather than Flask's stdlib-json provider
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+def save_upload(upload, dest: Path) -> None:
+    # Same as FileStorage.save, but copies in 1 MiB chunks instead of 16 KiB
+    with open(dest, "wb") as dst:
+        shutil.copyfileobj(upload.stream, dst, UPLOAD_COPY_CHUNK)
 
 @app.get("/health")
 def health():
-    return jsonify(status="ok")
+    return json_response({"status": "ok"})
 
 @app.post("/jobs")
 def create_job():
-    job_id = str(uuid.uuid4())
-    jdir = job_dir(job_id)
-    (jdir / "inputs").mkdir(parents=True, exist_ok=True)
+    job_id = uuid.uuid4().hex
+    jdir = ensure_job_dirs(job_id)
     script = request.files.get("script")
     gen = request.files.get("generator_inputs")
     if script:
-        script.save(jdir / "inputs" / "script.txt")
+        save_upload(script, jdir / "inputs" / "script.txt")
     if gen:
-        gen.save(jdir / "inputs" / "generator_inputs.json")
-    # Initialize status and start background job
-    from .jobs import start_job  # local import to avoid circulars in WSGI reload
-    (jdir / "status.json").write_text(json.dumps({"jobId": job_id, "status": "queued"}))
+        save_upload(gen, jdir / "inputs" / "generator_inputs.json")
+    # Initialize status (queued) and hand off to the job executor
     start_job(job_id)
-    return jsonify(jobId=job_id, status="queued", dataDir=str(jdir))
+    return json_response({"jobId": job_id, "status": "queued", "dataDir": str(jdir)})
 
 @app.get("/jobs/<job_id>")
 def get_job(job_id: str):
-    from .jobs import read_status
-    status = read_status(job_id)
-    if status.get("status") == "unknown":
-        return jsonify(error="not found"), 404
-    return jsonify(status)
+    body = read_status_bytes(job_id) if JOB_ID_RE.fullmatch(job_id) else None
+    if body is None:
+        return json_response({"error": "not found"}, 404)
+    # Already-serialized JSON straight from the status cache
+    resp = Response(body, mimetype="application/json")
+    # Pollers revalidate with If-None-Match and get an empty 304 while the status is unchanged
+    resp.add_etag(weak=True)
+    resp.cache_control.max_age = 1
+    resp.cache_control.must_revalidate = True
+    return resp.make_conditional(request)
+
+def _stop_dev_server(signum, frame):
+    drain_jobs()
+    sys.exit(0)
 
 if __name__ == "__main__":
-    # Dev server; in container we'll run gunicorn
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), debug=True)
\ No newline at end of file
+    # Dev server only; in production run: gunicorn -c gunicorn.conf.py app.server:app
+    # (gunicorn owns worker signals there and drains jobs via its worker_exit hook)
+    signal.signal(signal.SIGTERM, _stop_dev_server)
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)))
\ No newline at end of file
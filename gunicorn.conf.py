@@ -0,0 +1,21 @@
+import os
+
+# Production server settings: gunicorn -c gunicorn.conf.py app.server:app
+PORT = int(os.environ.get("PORT", 8000))
+
+bind = f"0.0.0.0:{PORT}"
+# Threaded workers: handlers are I/O-bound (uploads, status polls) and job
+# execution happens off the request thread, so threads give cheap concurrency.
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+# Requests are light; the heavy work is the render jobs, which are capped server-wide by
+# VPG_MAX_CONCURRENT_JOBS. Each worker still keeps its own job threads and pending-status
+# state, so a couple of workers is plenty.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+keepalive = 5
+
+
+def worker_exit(server, worker):
+    # Runs in the exiting worker: stop its orchestrator children and mark their jobs interrupted
+    from app.jobs import drain_jobs
+    drain_jobs()
@@ -7,11 +7,14 @@ What it does
 - Scans script.txt for tokens: spoken blocks, [PAUSE], [OVERLAY], and [ProcessFormSwap].
 - Aligns token order to director_visemes.json beats (speech vs pause).
 - For each [OVERLAY], picks the tc_in (seconds) of the next beat as insertion time.
-- Builds a final MP4 by:
-  - Transcoding pre/post segments from the base video with consistent encoding
-  - Creating a pause clip at each insertion time by freezing the exact frame
+- Builds a final MP4 in a single ffmpeg pass whose filter graph:
+  - Slices pre/post segments from the base video (input-level seeks)
+  - Creates a pause at each insertion time by freezing the exact frame
     and overlaying the provided slate PNG (with fade in/out) over silence
-  - Concatenating all segments losslessly via concat demuxer (-c copy)
+  - Concatenates all segments with the concat filter and encodes once
+- When the pre-slate pass (labels/icon) already re-encoded the base, it forces
+  keyframes at the insertion points instead; the base is then split by stream
+  copy, only the pause clips are encoded, and the concat demuxer copies video.
 
 Notes
 - This preserves A/V sync by inserting silence during the pause so subsequent
@@ -19,59 +22,83 @@ Notes
 - Requires ffmpeg in PATH.
 """
 import argparse
+from bisect import bisect_left
 import json
+import os
 import shlex
 import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 import re
 import tempfile
-from typing import Any, Dict
+import textwrap
+from typing import Any, Dict, Iterator
 import shutil
 import math
 
+try:
+    # orjson (already an app dependency) parses director/config/probe JSON several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
+
+TIMECODE = re.compile(r'(\d+):(\d+):(\d+(?:\.\d*)?)')
+
+
+@lru_cache(maxsize=4096)
 def parse_timecode_to_seconds(tc: str) -> float:
     tc = (tc or "").strip()
     if not tc:
         return 0.0
+    m = TIMECODE.fullmatch(tc)
+    if m:
+        return int(m[1]) * 3600 + int(m[2]) * 60 + float(m[3])
+    # Unusual forms (fractional hours/minutes, signs) take the general path
     hh, mm, ss = tc.split(":")
     return float(hh) * 3600.0 + float(mm) * 60.0 + float(ss)
 
 
 SPEAKER_LINE = re.compile(r'^\s*([A-Z0-9 ]+?)(?:\s*\(([A-Z \.]+)\))?\s*(?:\{[^}]*\})?\s*$')
+# A stripped speaker line can only start with one of these; checked before running the regex
+SPEAKER_START = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
 OVERLAY_MARKER = re.compile(r'^\[OVERLAY(\d+)?\]$', re.IGNORECASE)
 
 
-def parse_script_tokens(script_text: str) -> list[str]:
+def iter_script_events(script_text: str) -> Iterator[tuple[str, int | None]]:
     """
-    Return a list of tokens in chronological order:
+    Yield (kind, overlay_id) in chronological order, where kind is:
       - "line" for a spoken block (speaker line followed by 1+ text lines)
       - "pause" for a standalone [PAUSE]
-      - "overlay" for a standalone [OVERLAY] or [OVERLAYn]
+      - "overlay" for a standalone [OVERLAY] or [OVERLAYn] (overlay_id = n or None)
       - "pf_swap" for a standalone [ProcessFormSwap]
+    overlay_id is None for every kind other than "overlay".
     """
     lines = script_text.splitlines()
     i = 0
-    tokens: list[str] = []
     while i < len(lines):
         raw = lines[i].rstrip("\n")
         stripped = raw.strip()
         # Simple stage directives
         if stripped == "[PAUSE]":
-            tokens.append("pause")
+            yield "pause", None
             i += 1
             continue
-        if OVERLAY_MARKER.match(stripped):
-            tokens.append("overlay")
+        m = OVERLAY_MARKER.match(stripped)
+        if m:
+            g = m.group(1)
+            yield "overlay", (int(g) if g and g.isdigit() else None)
             i += 1
             continue
         if stripped == "[ProcessFormSwap]":
-            tokens.append("pf_swap")
+            yield "pf_swap", None
             i += 1
             continue
         # Speaker blocks
-        m = SPEAKER_LINE.match(stripped)
+        m = stripped[:1] in SPEAKER_START and SPEAKER_LINE.match(stripped)
         if m and i + 1 < len(lines):
             j = i + 1
             spoken_found = False
@@ -81,17 +108,16 @@ def parse_script_tokens(script_text: str) -> list[str]:
                     break
                 if t.startswith("[") and t.endswith("]"):
                     break
-                if SPEAKER_LINE.match(t):
+                if t[:1] in SPEAKER_START and SPEAKER_LINE.match(t):
                     break
                 # treat as spoken content or inline directives
                 spoken_found = True
                 j += 1
             if spoken_found:
-                tokens.append("line")
+                yield "line", None
             i = j
         else:
             i += 1
-    return tokens
 
 
 @dataclass
@@ -110,120 +136,153 @@ def build_beats_tokens(director: dict) -> list[BeatToken]:
     return tokens
 
 
-def extract_header_value(script_text: str, key_prefix: str) -> str:
-    """
-    Find a line like 'CONFLICT DESCRIPTION: something' and return the value trimmed.
-    """
-    for line in script_text.splitlines():
-        if line.upper().startswith(key_prefix.upper()):
-            # Split on first colon
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                return parts[1].strip()
-    return ""
-
-
-def wrap_text(src: str, max_chars: int = 64) -> str:
+def load_director(path: Path) -> tuple[Dict[str, Any], list[BeatToken]]:
     """
-    Simple hard wrap at whitespace boundaries for ffmpeg drawtext.
+    Read director_visemes.json in one pass, returning (top-level settings without
+    'beats', beat tokens). With ijson installed the file is streamed so per-beat
+    viseme data is never materialized; otherwise (or with ijson < 3.1, which lacks
+    use_float) the whole file is parsed with json_loads.
     """
-    words = src.split()
-    lines: list[str] = []
-    cur: list[str] = []
-    cur_len = 0
-    for w in words:
-        if cur_len + (1 if cur else 0) + len(w) > max_chars:
-            if cur:
-                lines.append(" ".join(cur))
-            cur = [w]
-            cur_len = len(w)
-        else:
-            cur.append(w)
-            cur_len += (1 if cur_len > 0 else 0) + len(w)
-    if cur:
-        lines.append(" ".join(cur))
-    return "\n".join(lines)
+    def load_whole() -> tuple[Dict[str, Any], list[BeatToken]]:
+        director = json_loads(path.read_bytes())
+        settings = {k: v for k, v in director.items() if k != "beats"}
+        return settings, build_beats_tokens(director)
 
-def map_overlays_to_times(script_tokens: list[str], beat_tokens: list[BeatToken], anchor: str = "prev_end") -> list[float]:
+    try:
+        import ijson  # type: ignore
+    except Exception:
+        return load_whole()
+    settings: Dict[str, Any] = {}
+    tokens: list[BeatToken] = []
+    key = None
+    builder = None
+    beat_type = None
+    beat_tc = "00:00:00.000"
+    with path.open("rb") as f:
+        try:
+            events = ijson.parse(f, use_float=True)
+        except TypeError:
+            return load_whole()
+        for prefix, event, value in events:
+            if prefix == "" and event == "map_key":
+                key = value
+                builder = ijson.ObjectBuilder() if key != "beats" else None
+                continue
+            if builder is not None:
+                # Non-beats top-level value: build it, done once its own prefix closes
+                builder.event(event, value)
+                if prefix == key and event not in ("start_map", "start_array", "map_key"):
+                    settings[key] = builder.value
+                    builder = None
+                continue
+            if prefix == "beats.item":
+                if event == "start_map":
+                    beat_type = None
+                    beat_tc = "00:00:00.000"
+                elif event == "end_map":
+                    kind = "pause" if beat_type == "pause" else "line"
+                    tokens.append(BeatToken(kind, parse_timecode_to_seconds(beat_tc)))
+            elif prefix == "beats.item.type":
+                beat_type = value
+            elif prefix == "beats.item.tc_in":
+                beat_tc = value
+    return settings, tokens
+
+
+@lru_cache(maxsize=64)
+def _header_pattern(key_prefixes: tuple[str, ...]) -> re.Pattern:
+    # One multiline pattern finding every line that starts with any of the keys
+    alternatives = "|".join(re.escape(k) for k in key_prefixes)
+    return re.compile(rf"^(?:{alternatives}).*$", re.IGNORECASE | re.MULTILINE)
+
+
+def extract_header_values(script_text: str, key_prefixes: list[str]) -> Dict[str, str]:
     """
-    Align script token sequence to beat token sequence by kind ("line"/"pause").
-    For each "overlay":
-      - anchor == "prev_end": use the END of the previous beat, which is the START of the next beat
-      - anchor == "next_start": use the START of the next beat
-    Fallbacks:
-      - if no next beat exists, drop overlay (can't place after end)
+    Batched extract_header_value: scan the script once for several header keys.
+    Returns {key_prefix: value} with "" for keys that are not found.
     """
-    overlay_times: list[float] = []
-    si = 0
-    bi = 0
-    while si < len(script_tokens):
-        st = script_tokens[si]
-        if st in ("line", "pause"):
-            # advance beats until we match the same kind
-            while bi < len(beat_tokens) and beat_tokens[bi].kind != st:
-                bi += 1
-            # consume one matched beat if present
-            if bi < len(beat_tokens):
-                bi += 1
-            si += 1
-            continue
-        if st == "overlay":
-            # overlay timing based on requested anchor
-            if bi < len(beat_tokens):
-                if anchor == "prev_end":
-                    # previous beat end == next beat start
-                    overlay_times.append(beat_tokens[bi].tc_in_sec)
-                else:
-                    # next_start (legacy behavior)
-                    overlay_times.append(beat_tokens[bi].tc_in_sec)
-            # If we're at end, we can't place overlay; silently skip
-            si += 1
+    result = {k: "" for k in key_prefixes}
+    pending = {k.upper(): k for k in key_prefixes}
+    for m in _header_pattern(tuple(key_prefixes)).finditer(script_text):
+        line = m.group(0)
+        # Split on first colon
+        parts = line.split(":", 1)
+        if len(parts) != 2:
             continue
-        # unknown token, skip
-        si += 1
-    return overlay_times
+        upper = line.upper()
+        for up in [up for up in pending if upper.startswith(up)]:
+            result[pending.pop(up)] = parts[1].strip()
+        if not pending:
+            break
+    return result
 
 
-def map_pf_swaps_to_times(script_tokens: list[str], beat_tokens: list[BeatToken], anchor: str = "prev_end") -> list[float]:
+def extract_header_value(script_text: str, key_prefix: str) -> str:
     """
-    Align script token sequence to beat token sequence; collect times for [ProcessFormSwap] markers.
-    Uses same anchoring strategy as overlays.
+    Find a line like 'CONFLICT DESCRIPTION: something' and return the value trimmed.
     """
-    times: list[float] = []
-    si = 0
-    bi = 0
-    while si < len(script_tokens):
-        st = script_tokens[si]
-        if st in ("line", "pause"):
-            while bi < len(beat_tokens) and beat_tokens[bi].kind != st:
-                bi += 1
-            if bi < len(beat_tokens):
-                bi += 1
-            si += 1
-            continue
-        if st == "pf_swap":
-            if bi < len(beat_tokens):
-                # For prev_end and next_start, this resolves to next beat start
-                times.append(beat_tokens[bi].tc_in_sec)
-            si += 1
-            continue
-        si += 1
-    return times
+    return extract_header_values(script_text, [key_prefix])[key_prefix]
 
 
-def parse_overlay_ids(script_text: str) -> list[int | None]:
+def wrap_text(src: str, max_chars: int = 64) -> str:
     """
-    Extract overlay numeric IDs in order of appearance in the script:
-    - [OVERLAY] => None
-    - [OVERLAY7] => 7
+    Simple hard wrap at whitespace boundaries for ffmpeg drawtext.
     """
-    ids: list[int | None] = []
-    for line in script_text.splitlines():
-        m = OVERLAY_MARKER.match(line.strip())
-        if m:
-            g = m.group(1)
-            ids.append(int(g) if g and g.isdigit() else None)
-    return ids
+    # Collapse runs of whitespace first; long words stay whole on their own line
+    return "\n".join(textwrap.wrap(
+        " ".join(src.split()), width=max_chars,
+        break_long_words=False, break_on_hyphens=False,
+    ))
+
+def _beat_positions(beat_tokens: list[BeatToken]) -> Dict[str, list[int]]:
+    # Sorted beat indices per kind, so "advance to the next beat of this kind"
+    # is a bisect instead of a linear walk over beats of the other kind
+    positions: Dict[str, list[int]] = {"line": [], "pause": []}
+    for i, b in enumerate(beat_tokens):
+        positions.setdefault(b.kind, []).append(i)
+    return positions
+
+
+def _consume_beat(positions: Dict[str, list[int]], kind: str, bi: int, n_beats: int) -> int:
+    # Index just past the first beat of `kind` at or after bi (n_beats if none is left)
+    pos = positions.get(kind, [])
+    k = bisect_left(pos, bi)
+    return pos[k] + 1 if k < len(pos) else n_beats
+
+
+def parse_script_and_align(
+    script_text: str,
+    beat_tokens: list[BeatToken],
+    anchor: str = "prev_end",
+) -> tuple[list[float], list[int | None], list[float]]:
+    """
+    Single pass over the script that tokenizes and aligns to the beats at once.
+    Each "line"/"pause" event consumes the next beat of the same kind; an
+    [OVERLAY] or [ProcessFormSwap] marker is placed at the start of the next
+    unconsumed beat (the end of the previous one), and gets no time once the
+    beats run out. Both anchors resolve to that next beat start.
+    Returns (overlay_times, overlay_ids, pf_swap_times); overlay_ids has an
+    entry for every [OVERLAY] marker (n for [OVERLAYn], else None).
+    """
+    overlay_times: list[float] = []
+    overlay_ids: list[int | None] = []
+    pf_swap_times: list[float] = []
+    n_beats = len(beat_tokens)
+    positions = _beat_positions(beat_tokens)
+    bi = 0
+    for kind, overlay_id in iter_script_events(script_text):
+        if kind in ("line", "pause"):
+            # advance beats until we match the same kind, then consume it
+            bi = _consume_beat(positions, kind, bi, n_beats)
+        elif kind == "overlay":
+            # IDs are kept for every marker; times only while a next beat exists
+            overlay_ids.append(overlay_id)
+            if bi < n_beats:
+                overlay_times.append(beat_tokens[bi].tc_in_sec)
+        elif kind == "pf_swap":
+            if bi < n_beats:
+                pf_swap_times.append(beat_tokens[bi].tc_in_sec)
+    return overlay_times, overlay_ids, pf_swap_times
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
@@ -244,7 +303,7 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     """
     suffix = config_path.suffix.lower()
     if suffix == ".json":
-        return json.loads(config_path.read_text() or "{}")
+        return json_loads(config_path.read_bytes() or b"{}")
     if suffix in (".yml", ".yaml"):
         return _load_yaml(config_path)
     raise SystemExit(f"Unsupported config file extension: {suffix}. Use .json, .yml, or .yaml.")
@@ -329,6 +388,71 @@ def build_overlay_config_lookup(cfg: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+@dataclass(frozen=True)
+class OverlaySettings:
+    duration: float
+    fade: float
+    alpha: float
+    pre_roll: float
+    image: str
+
+
+def resolve_overlay_settings(
+    overlay_id: int | None,
+    cfg_lookup: Dict[str, Any],
+    defaults: OverlaySettings,
+    fps: float,
+) -> OverlaySettings:
+    """
+    Apply the config entry for overlay_id (else the 'default' entry) over `defaults`.
+    Values that fail to parse keep the default; the image is resolved separately.
+    """
+    duration = defaults.duration
+    fade = defaults.fade
+    alpha = defaults.alpha
+    pre_roll = defaults.pre_roll
+    if overlay_id is not None and overlay_id in cfg_lookup.get("by_id", {}):
+        ov_cfg = cfg_lookup["by_id"][overlay_id]
+    else:
+        ov_cfg = cfg_lookup.get("default", {})
+    if isinstance(ov_cfg, dict):
+        if "duration" in ov_cfg:
+            try:
+                duration = float(ov_cfg.get("duration"))
+            except Exception:
+                pass
+        if "fade" in ov_cfg:
+            try:
+                fade = float(ov_cfg.get("fade"))
+            except Exception:
+                pass
+        if "overlay_alpha" in ov_cfg:
+            try:
+                alpha = float(ov_cfg.get("overlay_alpha"))
+            except Exception:
+                pass
+        if "pre_roll_sec" in ov_cfg:
+            try:
+                pre_roll = float(ov_cfg.get("pre_roll_sec"))
+            except Exception:
+                pass
+        elif "pre_roll_frames" in ov_cfg:
+            try:
+                pre_roll = max(0, int(ov_cfg.get("pre_roll_frames"))) / float(fps or 24)
+            except Exception:
+                pass
+    return replace(defaults, duration=duration, fade=fade, alpha=alpha, pre_roll=pre_roll)
+
+
+@lru_cache(maxsize=None)
+def _dir_entries(d: str) -> frozenset[str]:
+    # One listdir per candidate folder, shared by every overlay lookup
+    try:
+        return frozenset(os.listdir(d))
+    except OSError:
+        return frozenset()
+
+
 def find_overlay_image_for_id(
     overlay_id: int | None,
     args_overlay_image: str,
@@ -376,32 +500,36 @@ def find_overlay_image_for_id(
                 cfg_dir / "scenes" / name,
             ]
         for c in candidates:
-            if c.exists():
+            if name in _dir_entries(str(c.parent)):
                 return str(c)
     # 4) fallback to global overlay_image
     return str(Path(args_overlay_image))
 
 
-def run(cmd: list[str]) -> None:
+def run(cmd: list[str], stdin_data: bytes | None = None) -> None:
     print(" ", shlex.join(cmd))
-    proc = subprocess.run(cmd)
+    proc = subprocess.run(cmd, input=stdin_data)
     if proc.returncode != 0:
         raise SystemExit(proc.returncode)
 
 
+# Resolved once at import instead of a PATH search per probe
+FFPROBE = shutil.which("ffprobe")
+
+
 def ffprobe_stream_durations(path: str) -> dict:
     """
     Return {'video': seconds_or_None, 'audio': seconds_or_None, 'format': seconds_or_None}
     """
-    if not shutil.which("ffprobe"):
+    if not FFPROBE:
         return {"video": None, "audio": None, "format": None}
     try:
-        # Get per-stream durations
+        # Per-stream durations plus the format duration fallback in one probe
         p = subprocess.run(
-            ["ffprobe", "-v", "error", "-show_entries", "stream=codec_type,duration", "-of", "json", path],
+            [FFPROBE, "-v", "error", "-show_entries", "stream=codec_type,duration:format=duration", "-of", "json", path],
             capture_output=True, text=True
         )
-        info = json.loads(p.stdout or "{}")
+        info = json_loads(p.stdout or "{}")
         vdur = None
         adur = None
         for s in (info.get("streams") or []):
@@ -413,13 +541,8 @@ def ffprobe_stream_durations(path: str) -> dict:
                 vdur = d if vdur is None else vdur
             if s.get("codec_type") == "audio":
                 adur = d if adur is None else adur
-        # Fallback to format duration
-        pf = subprocess.run(
-            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=nw=1:nk=1", path],
-            capture_output=True, text=True
-        )
         try:
-            fdur = float(pf.stdout.strip())
+            fdur = float((info.get("format") or {}).get("duration"))
         except Exception:
             fdur = None
         return {"video": vdur, "audio": adur, "format": fdur}
@@ -427,6 +550,438 @@ def ffprobe_stream_durations(path: str) -> dict:
         return {"video": None, "audio": None, "format": None}
 
 
+def ffprobe_stream_params(path: str) -> dict:
+    """
+    Return {'video': {...}, 'audio': {...}} with the first stream of each type's codec
+    parameters (codec_name, pix_fmt, r_frame_rate, time_base, sample_rate, channels).
+    Empty dicts when ffprobe is unavailable or fails.
+    """
+    if not FFPROBE:
+        return {"video": {}, "audio": {}}
+    try:
+        p = subprocess.run(
+            [FFPROBE, "-v", "error", "-show_entries",
+             "stream=codec_type,codec_name,pix_fmt,width,height,r_frame_rate,time_base,sample_rate,channels",
+             "-of", "json", path],
+            capture_output=True, text=True
+        )
+        info = json_loads(p.stdout or "{}")
+    except Exception:
+        return {"video": {}, "audio": {}}
+    result: dict = {"video": {}, "audio": {}}
+    for s in (info.get("streams") or []):
+        kind = s.get("codec_type")
+        if kind in result and not result[kind]:
+            result[kind] = s
+    return result
+
+
+@lru_cache(maxsize=1)
+def detect_hw_h264_encoder() -> str | None:
+    """
+    Return the first usable hardware H.264 encoder (h264_videotoolbox, h264_nvenc,
+    h264_qsv) or None.
+    An encoder listed by `ffmpeg -encoders` may still lack a device, so each candidate
+    must also survive a tiny test encode. Probed once per process.
+    """
+    try:
+        p = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True)
+    except Exception:
+        return None
+    listed = {line.split()[1] for line in p.stdout.splitlines() if len(line.split()) > 1}
+    for name in ("h264_videotoolbox", "h264_nvenc", "h264_qsv"):
+        if name not in listed:
+            continue
+        test = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-v", "error", "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+             "-c:v", name, "-f", "null", "-"],
+            capture_output=True,
+        )
+        if test.returncode == 0:
+            return name
+    return None
+
+
+def h264_encoder_args(crf: int, hw: bool) -> list[str]:
+    """
+    Video codec flags for an H.264 encode: libx264 at `crf`, or the platform hardware
+    encoder when `hw` is set and one is available.
+    """
+    enc = detect_hw_h264_encoder() if hw else None
+    if enc == "h264_videotoolbox":
+        return ["-c:v", enc, "-b:v", "8M", "-realtime", "0"]
+    if enc == "h264_nvenc":
+        # Forced keyframes must be IDRs for the Phase 2 cuts to be clean
+        return ["-c:v", enc, "-preset", "p4", "-rc", "vbr", "-cq", str(int(crf)), "-b:v", "0", "-forced-idr", "1"]
+    if enc == "h264_qsv":
+        # ICQ rate control at the CRF-equivalent level; forced keyframes as IDRs, as above
+        return ["-c:v", enc, "-preset", "medium", "-global_quality", str(int(crf)), "-forced_idr", "1"]
+    return ["-c:v", "libx264", "-crf", str(int(crf))]
+
+
+def render_labels_png(
+    out_png: Path,
+    frame_size: tuple[int, int],
+    labels: list[tuple[int, int, str, str]],
+    bubble_path: str | None,
+    bubble_width: int,
+    bold_font: Path,
+    regular_font: Path,
+    title_size: int,
+    name_size: int,
+    line_spacing: int,
+) -> tuple[int, int] | None:
+    """
+    Render the static character labels (bubble + title + name per (cx, bottom, title, name))
+    once with Pillow, cropped to their bounding box. Geometry matches the drawtext chain.
+    Returns the (x, y) offset to overlay the PNG at, or None if Pillow is unavailable or fails.
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont  # type: ignore
+    except Exception:
+        return None
+    try:
+        frame_w, frame_h = frame_size
+        canvas = Image.new("RGBA", (frame_w, frame_h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(canvas)
+        title_font = ImageFont.truetype(str(bold_font), title_size)
+        name_font = ImageFont.truetype(str(regular_font), name_size)
+        bubble = None
+        if bubble_path:
+            src = Image.open(bubble_path).convert("RGBA")
+            bubble = src.resize((bubble_width, max(1, round(src.height * bubble_width / src.width))), Image.LANCZOS)
+        for cx, bottom, title, name in labels:
+            if bubble is not None:
+                canvas.alpha_composite(bubble, (int(cx - bubble.width / 2), frame_h - bottom - bubble.height))
+            title_y = frame_h - bottom - (title_size + line_spacing + name_size) / 2 - name_size - 35
+            draw.text((cx, title_y), title, font=title_font, fill="white", anchor="mt")
+            draw.text((cx, title_y + title_size + line_spacing), f"({name})", font=name_font, fill="white", anchor="mt")
+        bbox = canvas.getbbox()
+        if not bbox:
+            return None
+        canvas.crop(bbox).save(out_png)
+        return bbox[0], bbox[1]
+    except Exception as e:
+        print(f"[apply_overlays] Pillow label render failed ({e}); falling back to drawtext")
+        return None
+
+
+def render_text_block_png(
+    out_png: Path,
+    text: str,
+    fontfile: str,
+    fontsize: int,
+    color: str,
+    line_spacing: int,
+) -> bool:
+    """
+    Render a static multi-line text block once with Pillow, laid out like drawtext:
+    lines left-aligned, the block's top at the tallest glyph and a pitch of the text's
+    full glyph height plus line_spacing. Returns False if Pillow is unavailable or fails.
+    """
+    try:
+        from PIL import Image, ImageColor, ImageDraw, ImageFont  # type: ignore
+    except Exception:
+        return False
+    try:
+        font = ImageFont.truetype(fontfile, fontsize)
+        fill = ImageColor.getcolor(color.replace("0x", "#", 1), "RGBA")
+        lines = text.split("\n")
+        boxes = [font.getbbox(line, anchor="ls") for line in lines if line]
+        y_max = -min((b[1] for b in boxes), default=0)
+        y_min = -max((b[3] for b in boxes), default=0)
+        pitch = y_max - y_min + line_spacing
+        width = max(1, math.ceil(max(font.getlength(line) for line in lines)))
+        height = max(1, len(lines) * pitch - line_spacing)
+        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(canvas)
+        for i, line in enumerate(lines):
+            draw.text((0, i * pitch + y_max), line, font=font, fill=fill, anchor="ls")
+        canvas.save(out_png)
+        return True
+    except Exception as e:
+        print(f"[apply_overlays] Pillow text render failed ({e}); falling back to drawtext")
+        return False
+
+
+# Graphs longer than this go to ffmpeg through a script file rather than argv
+FILTER_SCRIPT_MIN_CHARS = 60000
+
+
+@contextmanager
+def filter_complex_args(filter_parts: list[str], script_path: Path) -> Iterator[list[str]]:
+    """
+    Yield the ffmpeg args for a filtergraph: inline -filter_complex for normal
+    graphs, -filter_complex_script for very long ones (long countdowns, many
+    pauses), which stay clear of ARG_MAX. The script is written to script_path
+    (in the caller's working dir) and removed when the block exits.
+    """
+    graph = ";".join(filter_parts)
+    if len(graph) < FILTER_SCRIPT_MIN_CHARS:
+        yield ["-filter_complex", graph]
+        return
+    script_path.write_text(graph, encoding="utf-8")
+    try:
+        yield ["-filter_complex_script", str(script_path)]
+    finally:
+        script_path.unlink(missing_ok=True)
+
+
+# Countdown circle size and placement: 60px from the left, 45px from the bottom
+TIMER_SIZE = 220
+TIMER_X = 60
+TIMER_Y = f"(main_h-{TIMER_SIZE}-45)"
+# drawtext size whose digit height matches the NumbersBold PNGs at their timer scale
+TIMER_FONT_SIZE = 75
+
+
+def add_timer_filters(
+    filter_parts: list[str],
+    src: str,
+    circle_idx: int,
+    digit0_idx: int,
+    duration: float,
+    fade: float,
+    tag: str,
+    fps: int,
+    circle_x: int = TIMER_X,
+    circle_y: str = TIMER_Y,
+    group_fade: bool = False,
+) -> str:
+    """
+    Append the countdown timer (TimerCircle + NumbersBold digits) over stream `src`.
+    Inputs: circle_idx = TimerCircle.png, digit0_idx..digit0_idx+9 = digits 0..9, all as
+    single frames; the circle is scaled once and looped in-graph. The digits are packed
+    into one atlas and each digit column is a single overlay that picks its cell by time.
+    Labels are prefixed with `tag` so several timers can live in one graph. Returns the
+    output stream label.
+    With group_fade (for a transparent `src`), the overlay-level fade is applied once to
+    the finished timer instead of separately to the circle and every digit column.
+    """
+    ft_out = max(0.0, duration - fade)
+    # Fade timings are formatted once and shared by the circle and every digit column
+    f_fade = f"{float(fade):.3f}"
+    f_ft_out = f"{float(ft_out):.3f}"
+    # Number PNG dimensions (w,h) in px as provided
+    digit_size: dict[str, tuple[int,int]] = {
+        "1": (58, 130),
+        "2": (94, 132),
+        "3": (99, 134),
+        "4": (105, 130),
+        "5": (97, 132),
+        "6": (101, 134),
+        "7": (92, 130),
+        "8": (101, 134),
+        "9": (101, 134),
+        "0": (105, 134),
+    }
+    circle_src_w = 701
+    circle_src_h = 701
+    circle_w = TIMER_SIZE
+    circle_h = TIMER_SIZE
+    scale_factor = float(circle_w) / float(circle_src_w)
+    # Make digits 25% larger than the circle's scale
+    digit_scale_factor = scale_factor * 1.25
+    gap = 7
+    # Countdown windows:
+    # - Start showing first number at t=0 (during fade-in)
+    # - Show 0 starting 1s before fade-out starts, and keep 0 through fade-out to the end
+    zero_start = max(0.0, float(ft_out) - 1.0)
+    # Build 1-second windows ending at zero_start and going backward in 1s blocks, clipped at t=0
+    steps: list[tuple[float, float]] = []
+    t_end = float(zero_start)
+    while t_end > 0.0:
+        t_start = max(0.0, t_end - 1.0)
+        steps.insert(0, (t_start, t_end))
+        if t_start <= 0.0:
+            break
+        t_end = t_start
+    # Normalize base format
+    filter_parts.append(f"[{src}]format=rgba[{tag}v0]")
+    # Timer circle visible for entire pause (including fades); scale to 220x220
+    hold_frames = max(1, int(round(float(duration) * fps)))
+    circle_loop = f"loop=loop={hold_frames - 1}:size=1,setpts=N/{int(fps)}/TB"
+    circle_enable = f"between(t,0,{float(duration):.3f})"
+
+    def finish_fade(label: str) -> str:
+        # Group fade: one alpha fade over the finished timer
+        if not group_fade or float(fade) <= 0.0:
+            return label
+        filter_parts.append(
+            f"[{label}]fade=t=in:st=0:d={f_fade}:alpha=1,"
+            f"fade=t=out:st={f_ft_out}:d={f_fade}:alpha=1[{tag}gf]"
+        )
+        return f"{tag}gf"
+
+    # Apply overlay-level fade to circle if fade > 0
+    layer_fade = float(fade) > 0.0 and not group_fade
+    if layer_fade:
+        filter_parts.append(
+            f"[{circle_idx}:v]scale={circle_w}:{circle_h},format=rgba,{circle_loop},"
+            f"fade=t=in:st=0:d={f_fade}:alpha=1,"
+            f"fade=t=out:st={f_ft_out}:d={f_fade}:alpha=1[{tag}tc]"
+        )
+    else:
+        filter_parts.append(f"[{circle_idx}:v]scale={circle_w}:{circle_h},format=rgba,{circle_loop}[{tag}tc]")
+    filter_parts.append(f"[{tag}v0][{tag}tc]overlay=x={circle_x}:y={circle_y}:format=auto:enable='{circle_enable}'[{tag}vc]")
+    cur = f"{tag}vc"
+    # Helper to compute positions per value string
+    def layout_for_value(val: int) -> list[tuple[str, int, str, int, int]]:
+        s = str(max(0, int(val)))
+        # Compute total width including gap
+        scaled_widths = [int(round(digit_size[ch][0] * digit_scale_factor)) for ch in s]
+        scaled_heights = [int(round(digit_size[ch][1] * digit_scale_factor)) for ch in s]
+        total_w = sum(scaled_widths) + gap * (len(s) - 1 if len(s) > 1 else 0)
+        x_left = circle_x + int((circle_w - total_w) / 2)
+        placements: list[tuple[str, int, str, int, int]] = []
+        x_cursor = x_left
+        for i, ch in enumerate(s):
+            sw = scaled_widths[i]
+            sh = scaled_heights[i]
+            # y to vertically center this digit within the circle
+            y_expr = f"({circle_y}+{int((circle_h - sh) / 2)})"
+            placements.append((ch, x_cursor, y_expr, sw, sh))
+            x_cursor += sw + gap
+        return placements
+    # Countdown windows as (start, end, value, quick fade-in, quick fade-out):
+    # one per second down to 1, then 0 held (fade-in only) through the fade-out
+    windows: list[tuple[float, float, int, float, float]] = []
+    num_steps = len(steps)
+    for i, (start_t, end_t) in enumerate(steps):
+        if end_t - start_t <= 0.0:
+            continue
+        # Quick fade durations (0.1s each side, but clamp to half the window)
+        fi = min(0.1, max(0.0, (end_t - start_t) / 2.0))
+        windows.append((start_t, end_t, num_steps - i, fi, fi))
+    if float(duration) > 0.0:
+        z_start = max(0.0, float(zero_start))
+        z_end = float(duration)
+        if z_end > z_start:
+            windows.append((z_start, z_end, 0, min(0.1, max(0.0, (z_end - z_start) / 2.0)), 0.0))
+    if not windows:
+        return finish_fade(cur)
+
+    # Digit atlas: each digit scaled once into a cell of a single-frame strip. Digits sit
+    # left-aligned in their cell, offset down by their centring within the circle, so a
+    # cell placed at a digit's layout x and one shared y lands the digit exactly.
+    dims = {ch: (int(round(w * digit_scale_factor)), int(round(h * digit_scale_factor))) for ch, (w, h) in digit_size.items()}
+    y_offs = {ch: int((circle_h - h) / 2) for ch, (w, h) in dims.items()}
+    y_base = min(y_offs.values())
+    cell_w = max(w for w, h in dims.values())
+    cell_h = max(h + y_offs[ch] - y_base for ch, (w, h) in dims.items())
+    for d in range(10):
+        w, h = dims[str(d)]
+        filter_parts.append(
+            f"[{digit0_idx + d}:v]scale={w}:{h},format=rgba,"
+            f"pad={cell_w}:{cell_h}:0:{y_offs[str(d)] - y_base}:color=black@0[{tag}c{d}]"
+        )
+    # One column per digit position (ones, tens, ...), each cropped from the looped atlas
+    n_cols = max(len(str(v)) for _, _, v, _, _ in windows)
+    filter_parts.append(
+        "".join(f"[{tag}c{d}]" for d in range(10))
+        + f"hstack=inputs=10,loop=loop={hold_frames - 1}:size=1,setpts=N/{int(fps)}/TB"
+        + (f",split={n_cols}" if n_cols > 1 else "")
+        + "".join(f"[{tag}a{c}]" for c in range(n_cols))
+    )
+    # Each countdown value is laid out once and shared by every column
+    layouts = {value: layout_for_value(value) for _, _, value, _, _ in windows}
+    # Per-window strings (start, end, quick fades), formatted once and shared by every column.
+    # The quick crossfades are each active only inside their own window.
+    window_strs: list[tuple[str, str, list[str]]] = []
+    for start_t, end_t, _, fi, fo in windows:
+        start_s = f"{start_t:.3f}"
+        end_s = f"{end_t:.3f}"
+        enable_s = f"enable='between(t,{start_s},{end_s})'"
+        quick = []
+        if fi > 0.0:
+            quick.append(f"fade=t=in:st={start_s}:d={fi:.3f}:alpha=1:{enable_s}")
+        if fo > 0.0:
+            quick.append(f"fade=t=out:st={(end_t - fo):.3f}:d={fo:.3f}:alpha=1:{enable_s}")
+        window_strs.append((start_s, end_s, quick))
+    for col in range(n_cols):
+        # Windows where this column shows a digit: (window index, digit, x)
+        col_windows = []
+        for wi, (_, _, value, _, _) in enumerate(windows):
+            placements = layouts[value]
+            if col < len(placements):
+                ch, x_pos, _, _, _ = placements[len(placements) - 1 - col]
+                col_windows.append((wi, int(ch), x_pos))
+        if not col_windows:
+            continue
+        # Piecewise-by-time atlas cell and x position, emitted outermost-first and closed
+        # once; the last window covers the rest
+        crop_parts = []
+        pos_parts = []
+        for wi, digit, x_pos in col_windows[:-1]:
+            end_s = window_strs[wi][1]
+            crop_parts.append(f"if(lt(t,{end_s}),{digit * cell_w},")
+            pos_parts.append(f"if(lt(t,{end_s}),{x_pos},")
+        closing = ")" * (len(col_windows) - 1)
+        crop_x = "".join(crop_parts) + str(col_windows[-1][1] * cell_w) + closing
+        pos_x = "".join(pos_parts) + str(col_windows[-1][2]) + closing
+        chain = [f"crop=w={cell_w}:h={cell_h}:x='{crop_x}':y=0"]
+        if layer_fade:
+            chain.append(f"fade=t=in:st=0:d={f_fade}:alpha=1")
+            chain.append(f"fade=t=out:st={f_ft_out}:d={f_fade}:alpha=1")
+        for wi, _, _ in col_windows:
+            chain.extend(window_strs[wi][2])
+        filter_parts.append(f"[{tag}a{col}]" + ",".join(chain) + f"[{tag}k{col}]")
+        enable = f"between(t,{window_strs[col_windows[0][0]][0]},{window_strs[col_windows[-1][0]][1]})"
+        filter_parts.append(
+            f"[{cur}][{tag}k{col}]overlay=x='{pos_x}':y=({circle_y}+{y_base}):format=auto:enable='{enable}'[{tag}t{col}]"
+        )
+        cur = f"{tag}t{col}"
+    return finish_fade(cur)
+
+
+def render_timer_clip(
+    out_mov: Path,
+    circle_path: Path,
+    digit_paths: list[Path] | None,
+    numbers_font: Path | None,
+    duration: float,
+    fade: float,
+    fps: int,
+) -> None:
+    """
+    Render the countdown alone (circle + digits on a transparent TIMER_SIZE square) to a
+    lossless RGBA movie, so every pause with the same duration and fade overlays one
+    prerendered clip instead of rebuilding the timer graph. Without digit PNGs, the
+    digits come from a single drawtext with numbers_font that computes the value from t
+    (same values and timing, without the per-second quick crossfades).
+    """
+    hold_frames = max(1, int(round(duration * fps)))
+    parts = [f"color=c=black@0:s={TIMER_SIZE}x{TIMER_SIZE}:r={fps},format=rgba,trim=end_frame={hold_frames}[tb]"]
+    inputs = ["-i", str(circle_path)]
+    if digit_paths:
+        vout = add_timer_filters(parts, "tb", 0, 1, duration, fade, "t", fps, circle_x=0, circle_y="0", group_fade=True)
+        for p in digit_paths:
+            inputs += ["-i", str(p)]
+    else:
+        ft_out = max(0.0, duration - fade)
+        # Countdown value: ceil(seconds left until 0 shows), 0 from 1s before the fade-out
+        zero_start = max(0.0, ft_out - 1.0)
+        value = f"%{{eif\\:ceil(max(0,{zero_start:.3f}-t))\\:d}}"
+        chain = [
+            "overlay=x=0:y=0:format=auto",
+            f"drawtext=fontfile='{numbers_font}':fontcolor=white:fontsize={TIMER_FONT_SIZE}:"
+            f"text='{value}':x=(w-text_w)/2:y=(h-text_h)/2",
+        ]
+        if fade > 0.0:
+            chain.append(f"fade=t=in:st=0:d={fade:.3f}:alpha=1")
+            chain.append(f"fade=t=out:st={ft_out:.3f}:d={fade:.3f}:alpha=1")
+        parts.append(
+            f"[0:v]scale={TIMER_SIZE}:{TIMER_SIZE},format=rgba,"
+            f"loop=loop={hold_frames - 1}:size=1,setpts=N/{int(fps)}/TB[tc]"
+        )
+        parts.append("[tb][tc]" + ",".join(chain) + "[tv]")
+        vout = "tv"
+    with filter_complex_args(parts, out_mov.with_suffix(".filters.txt")) as fc_args:
+        run(["ffmpeg", "-y"] + inputs + fc_args + [
+            "-map", f"[{vout}]", "-frames:v", str(hold_frames), "-c:v", "qtrle", "-pix_fmt", "argb", str(out_mov),
+        ])
+
+
 def main():
     # First parse only --config to seed defaults
     ap0 = argparse.ArgumentParser(add_help=False)
@@ -475,6 +1030,8 @@ def main():
     ap.add_argument("--labels_bubble_y", type=int, default=80, help="Bubble top y in px (default 80)")
     ap.add_argument("--labels_text_offset_y", type=int, default=10, help="Text offset inside bubble in px (default 10)")
     ap.add_argument("--crf", type=int, default=18, help="libx264 quality (default 18)")
+    ap.add_argument("--hw_encode", action="store_true", help="Encode H.264 with VideoToolbox/NVENC/Quick Sync when available (falls back to libx264)")
+    ap.add_argument("--jobs", type=int, default=0, help="Pause clips encoded in parallel (default: half the CPU cores)")
     ap.add_argument("--audio_bitrate", default="192k", help="AAC bitrate (default 192k)")
     ap.add_argument("--fps", type=int, default=0, help="Override FPS; defaults to director fps")
     # Intro slate from conflict description
@@ -505,9 +1062,10 @@ def main():
     base_audio_s = pr.get("audio")
     base_format_s = pr.get("format")
     # Count overlays
+    script_text = None
     try:
-        script_text_raw = Path(args.script).read_text()
-        num_overlays = script_text_raw.count("[OVERLAY]")
+        script_text = Path(args.script).read_text()
+        num_overlays = script_text.count("[OVERLAY]")
     except Exception:
         num_overlays = None
     est_added = (float(args.duration) * (num_overlays or 0)) + (float(args.intro_duration) if (args.intro_bg and len(args.intro_bg) >= 1) else 0.0)
@@ -519,19 +1077,26 @@ def main():
         print(f"[preflight] Overlay markers: {num_overlays}  pause_d={float(args.duration):.3f}s  intro={'yes' if (args.intro_bg and len(args.intro_bg) >= 1) else 'no'}")
     if base_format_s:
         print(f"[preflight] Estimated final duration ≈ {base_format_s + est_added:.3f}s (base + overlays + intro)")
-    # Warn if audio is significantly longer than video (may cause extension if not shortest)
+    # Warn if audio is significantly longer than video: nothing trims it, so the output runs long
     if (base_audio_s and base_video_s) and (base_audio_s - base_video_s > 1.0):
-        print(f"[preflight] Warning: base audio ({base_audio_s:.3f}s) > video ({base_video_s:.3f}s) by >1s. Capping pre-slate to shortest to avoid unintended extension.")
+        print(f"[preflight] Warning: base audio ({base_audio_s:.3f}s) > video ({base_video_s:.3f}s) by >1s. The audio is kept in full, so the output's audio runs past its last video frame.")
 
-    script_text = Path(args.script).read_text()
-    director = json.loads(Path(args.director).read_text())
+    if script_text is None:
+        script_text = Path(args.script).read_text()
+    director, beat_tokens = load_director(Path(args.director))
     fps = int(args.fps or director.get("fps", 24))
     base = str(Path(args.base))
     slate = str(Path(args.overlay_image))
     out_path = str(Path(args.out))
+    # Every write of the deliverable puts the moov atom up front, so it starts playing
+    # before it is fully downloaded whichever phase writes it last
+    faststart = ["-movflags", "+faststart"]
     pause_d = float(args.duration)
     fade_d = float(args.fade)
     overlay_alpha = max(0.0, min(1.0, float(args.overlay_alpha)))
+    h264_args = h264_encoder_args(int(args.crf), bool(getattr(args, "hw_encode", False)))
+    if getattr(args, "hw_encode", False):
+        print(f"[apply_overlays] H.264 encoder: {h264_args[1]}")
     # Always-on logo config (hardcoded)
     # Prefer top-level assets; fallback to common project subfolders if needed
     primary_logo = Path("/Users/michaelmahoney/Desktop/MediatorSPARK/assets/SPARKLogoFinal.png")
@@ -551,14 +1116,53 @@ def main():
     else:
         pre_roll_sec = max(0, int(args.pre_roll_frames)) / float(fps or 24)
 
-    script_tokens = parse_script_tokens(script_text)
-    beat_tokens = build_beats_tokens(director)
-    overlay_times = map_overlays_to_times(script_tokens, beat_tokens, anchor=args.anchor)
-    pf_swap_times = map_pf_swaps_to_times(script_tokens, beat_tokens, anchor=args.anchor)
-    overlay_ids = parse_overlay_ids(script_text)
+    overlay_times, overlay_ids, pf_swap_times = parse_script_and_align(script_text, beat_tokens, anchor=args.anchor)
+
+    # Resolve each overlay's settings and insertion time up front so Phase 1 can
+    # place keyframes exactly where Phase 2 cuts the timeline
+    cfg_lookup = build_overlay_config_lookup(cfg)
+    cfg_dir = cfg_path.parent if cfg_path else None
+
+    # Settings depend only on the overlay id; bare [OVERLAY] markers all share one entry
+    defaults = OverlaySettings(float(args.duration), float(args.fade), overlay_alpha, pre_roll_sec, slate)
+    settings_by_id: dict[int | None, OverlaySettings] = {}
+    overlay_plan: list[dict[str, Any]] = []
+    t_cursor = 0.0
+    for idx, t_overlay in enumerate(overlay_times):
+        ov_id = overlay_ids[idx] if idx < len(overlay_ids) else None
+        if ov_id not in settings_by_id:
+            # Choose image for this overlay
+            slate_img = find_overlay_image_for_id(
+                ov_id,
+                slate,
+                cfg_lookup,
+                cfg_dir,
+                Path(args.script),
+                Path(args.base),
+            )
+            settings_by_id[ov_id] = replace(resolve_overlay_settings(ov_id, cfg_lookup, defaults, fps), image=slate_img)
+        settings = settings_by_id[ov_id]
+        # Apply pre-roll (shift earlier)
+        t_ins = max(0.0, t_overlay - settings.pre_roll)
+        # Enforce monotonic timeline
+        if t_ins < t_cursor:
+            t_ins = t_cursor
+        # Snap to the first frame at/after t_ins (the frame the pause freezes)
+        t_ins = math.ceil(t_ins * fps - 1e-6) / fps
+        overlay_plan.append({
+            "t_ins": t_ins,
+            "duration": settings.duration,
+            "fade": settings.fade,
+            "alpha": settings.alpha,
+            "image": settings.image,
+        })
+        t_cursor = t_ins
+    # Quarter-frame bias keeps seek/cut points strictly between frame timestamps
+    edge = 0.25 / float(fps)
 
     # Phase 1: optional pre-slate compositing (ProcessForm icon + labels)
     base_for_pause = base
+    logo_baked = False
     if (args.pf_icon and pf_swap_times) or args.labels:
         # Build x(t) expression for right<->left moves with animation (will be overridden below)
         ANIM = max(0.01, float(args.pf_anim_sec))
@@ -583,24 +1187,27 @@ def main():
             swaps = sorted(float(t) for t in pf_swap_times)
             end_state = "left" if (len(swaps) % 2 == 1) else "right"
             end_expr = left_x() if end_state == "left" else right_x()
-            nested = end_expr
-            state = end_state
-            for t0 in reversed(swaps):
-                prev_state = "right" if state == "left" else "left"
-                anim_expr = ramp_rl(t0) if prev_state == "right" else ramp_lr(t0)
-                nested = f"if(between(t,{t0:.3f},{t0+ANIM:.3f}), {anim_expr}, {nested})"
-                hold_expr = right_x() if prev_state == "right" else left_x()
-                nested = f"if(lt(t,{t0:.3f}), {hold_expr}, {nested})"
-                state = prev_state
-            xexpr = nested.replace(",", r"\,")
+            # The icon starts on the right and toggles at every swap. Emit the nested
+            # if() chain outermost-first and close it once, rather than re-wrapping
+            # (and re-copying) the whole expression for each swap.
+            x_parts = []
+            for i, t0 in enumerate(swaps):
+                from_right = (i % 2 == 0)
+                hold_expr = right_x() if from_right else left_x()
+                anim_expr = ramp_rl(t0) if from_right else ramp_lr(t0)
+                x_parts.append(f"if(lt(t,{t0:.3f}), {hold_expr}, if(between(t,{t0:.3f},{t0+ANIM:.3f}), {anim_expr}, ")
+            x_parts.append(end_expr)
+            x_parts.append("))" * len(swaps))
+            xexpr = "".join(x_parts).replace(",", r"\,")
         # Y position expression: 75px from bottom
         pf_y_expr = f"(main_h - overlay_h - 75)"
 
         # Prepare label texts from script header
-        d1_name = extract_header_value(script_text, "DISPUTANT 1 NAME:")
-        d2_name = extract_header_value(script_text, "DISPUTANT 2 NAME:")
-        ma_name = extract_header_value(script_text, "MEDIATOR A NAME:")
-        mb_name = extract_header_value(script_text, "MEDIATOR B NAME:")
+        headers = extract_header_values(script_text, ["DISPUTANT 1 NAME:", "DISPUTANT 2 NAME:", "MEDIATOR A NAME:", "MEDIATOR B NAME:"])
+        d1_name = headers["DISPUTANT 1 NAME:"]
+        d2_name = headers["DISPUTANT 2 NAME:"]
+        ma_name = headers["MEDIATOR A NAME:"]
+        mb_name = headers["MEDIATOR B NAME:"]
         def first_name(full: str) -> str:
             full = (full or "").strip()
             if not full:
@@ -648,482 +1255,423 @@ def main():
         next_input_idx = 1
         # Optional icon input
         if args.pf_icon and pf_swap_times:
-            input_args += ["-loop", "1", "-i", str(Path(args.pf_icon))]
+            input_args += ["-i", str(Path(args.pf_icon))]
             filter_parts.append(f"[{next_input_idx}:v]scale={int(args.pf_width)}:-1,format=rgba[ic]")
             filter_parts.append(f"[0:v][ic]overlay=x={xexpr}:y={pf_y_expr}:format=auto[v0]")
             next_input_idx += 1
         else:
             # normalize pixel format to avoid odd overlay behavior
             filter_parts.append(f"[0:v]format=rgba[v0]")
-        # Optional bubble input
-        have_bubble = bool(args.labels_bubble)
-        if have_bubble:
-            input_args += ["-loop", "1", "-i", str(Path(args.labels_bubble))]
-            # Scale to requested width (hard-coded 289) then split for reuse
-            filter_parts.append(f"[{next_input_idx}:v]scale={bubble_width}:-1,format=rgba,split=4[nb1][nb2][nb3][nb4]")
+        # Static labels: pre-render once with Pillow and overlay a single still,
+        # instead of evaluating 8 drawtext + 4 bubble overlays on every frame
+        label_specs = [
+            (cx_px[0], bottom_px[0], "Disputant 1", first_name(d1_name) or "Unknown"),
+            (cx_px[1], bottom_px[1], "Mediator A", first_name(ma_name) or "Unknown"),
+            (cx_px[2], bottom_px[2], "Mediator B", first_name(mb_name) or "Unknown"),
+            (cx_px[3], bottom_px[3], "Disputant 2", first_name(d2_name) or "Unknown"),
+        ]
+        base_v = ffprobe_stream_params(base)["video"]
+        labels_png = tmp_labels_dir / "labels.png"
+        labels_xy = None
+        if base_v.get("width") and base_v.get("height"):
+            labels_xy = render_labels_png(
+                labels_png, (int(base_v["width"]), int(base_v["height"])), label_specs,
+                str(Path(args.labels_bubble)) if args.labels_bubble else None, bubble_width,
+                bold_font, regular_font, title_size, name_size, line_spacing,
+            )
+        if labels_xy is not None:
+            input_args += ["-i", str(labels_png)]
+            filter_parts.append(f"[v0][{next_input_idx}:v]overlay=x={labels_xy[0]}:y={labels_xy[1]}:format=auto[vlab]")
             next_input_idx += 1
-
-        # Add four overlays (bubble if provided) + drawtext sequentially
-        # Helper to add one label (bubble + two lines), index i maps to above arrays
-        def add_label(prev_stream: str, i: int, title_text: str, name_text: str, nb_tag: str) -> str:
-            # Bubble placement: center on cx_px[i], y from top using bottom distance
+            final_stream = "vlab"
+        else:
+            # Optional bubble input
+            have_bubble = bool(args.labels_bubble)
             if have_bubble:
-                filter_parts.append(
-                    f"[{prev_stream}][{nb_tag}]overlay=x=({cx_px[i]}-overlay_w/2):y=(main_h-{bottom_px[i]}-overlay_h):format=auto[vb{i}]"
-                )
-                s = f"vb{i}"
+                input_args += ["-i", str(Path(args.labels_bubble))]
+                # Scale to requested width (hard-coded 289) then split for reuse
+                filter_parts.append(f"[{next_input_idx}:v]scale={bubble_width}:-1,format=rgba,split=4[nb1][nb2][nb3][nb4]")
+                next_input_idx += 1
+
+            # Add four overlays (bubble if provided) + drawtext sequentially
+            # Helper to add one label (bubble + two lines), index i maps to above arrays
+            def add_label(prev_stream: str, i: int, title_text: str, name_text: str, nb_tag: str) -> str:
+                # One comma-chained filter chain per person: [bubble overlay,] title, name
+                # Bubble placement: center on cx_px[i], y from top using bottom distance
+                if have_bubble:
+                    chain_in = f"[{prev_stream}][{nb_tag}]"
+                    chain = [f"overlay=x=({cx_px[i]}-overlay_w/2):y=(main_h-{bottom_px[i]}-overlay_h):format=auto"]
+                else:
+                    chain_in = f"[{prev_stream}]"
+                    chain = []
+                # Title (bold), aligned center on cx, vertical approx centered in bubble using bottom distance
+                title_y = f"(main_h - {bottom_px[i]} - ({title_size}+{line_spacing}+{name_size})/2 - {name_size} - 35)"
+                draw_title = ":".join([
+                    f"fontfile='{bold_font}'",
+                    "fontcolor=white",
+                    f"fontsize={title_size}",
+                    f"text='{title_text}'",
+                    f"x=({cx_px[i]}-text_w/2)",
+                    f"y={title_y}",
+                ])
+                chain.append(f"drawtext={draw_title}")
+                # Name (regular), centered under title
+                name_y = f"({title_y}+{title_size}+{line_spacing})"
+                draw_name = ":".join([
+                    f"fontfile='{regular_font}'",
+                    "fontcolor=white",
+                    f"fontsize={name_size}",
+                    f"text='({name_text})'",
+                    f"x=({cx_px[i]}-text_w/2)",
+                    f"y={name_y}",
+                ])
+                chain.append(f"drawtext={draw_name}")
+                out_tag = f"vo{i}"
+                filter_parts.append(chain_in + ",".join(chain) + f"[{out_tag}]")
+                return out_tag
+
+            # D1
+            if have_bubble:
+                next_stream = add_label("v0", 0, "Disputant 1", first_name(d1_name) or "Unknown", "nb1")
             else:
-                s = prev_stream
-            # Title (bold), aligned center on cx, vertical approx centered in bubble using bottom distance
-            title_y = f"(main_h - {bottom_px[i]} - ({title_size}+{line_spacing}+{name_size})/2 - {name_size} - 35)"
-            draw_title = ":".join([
-                f"fontfile='{bold_font}'",
-                "fontcolor=white",
-                f"fontsize={title_size}",
-                f"text='{title_text}'",
-                f"x=({cx_px[i]}-text_w/2)",
-                f"y={title_y}",
-            ])
-            filter_parts.append(f"[{s}]drawtext={draw_title}[vt{i}]")
-            # Name (regular), centered under title
-            name_y = f"({title_y}+{title_size}+{line_spacing})"
-            draw_name = ":".join([
-                f"fontfile='{regular_font}'",
-                "fontcolor=white",
-                f"fontsize={name_size}",
-                f"text='({name_text})'",
-                f"x=({cx_px[i]}-text_w/2)",
-                f"y={name_y}",
-            ])
-            out_tag = f"vo{i}"
-            filter_parts.append(f"[vt{i}]drawtext={draw_name}[{out_tag}]")
-            return out_tag
-
-        # D1
-        if have_bubble:
-            next_stream = add_label("v0", 0, "Disputant 1", first_name(d1_name) or "Unknown", "nb1")
-        else:
-            next_stream = add_label("v0", 0, "Disputant 1", first_name(d1_name) or "Unknown", "nb1")
-        # Mediator A
-        # Mediator A
-        next_stream = add_label(next_stream, 1, "Mediator A", first_name(ma_name) or "Unknown", "nb2")
-        # Mediator B
-        # Mediator B
-        next_stream = add_label(next_stream, 2, "Mediator B", first_name(mb_name) or "Unknown", "nb3")
-        # D2
-        # D2
-        final_stream = add_label(next_stream, 3, "Disputant 2", first_name(d2_name) or "Unknown", "nb4")
-
-        base_labels = str(Path(out_path).with_suffix(".pre_slates.mp4"))
+                next_stream = add_label("v0", 0, "Disputant 1", first_name(d1_name) or "Unknown", "nb1")
+            # Mediator A
+            # Mediator A
+            next_stream = add_label(next_stream, 1, "Mediator A", first_name(ma_name) or "Unknown", "nb2")
+            # Mediator B
+            # Mediator B
+            next_stream = add_label(next_stream, 2, "Mediator B", first_name(mb_name) or "Unknown", "nb3")
+            # D2
+            # D2
+            final_stream = add_label(next_stream, 3, "Disputant 2", first_name(d2_name) or "Unknown", "nb4")
+
+        # Bake the permanent logo here too, so Phase 2 can stream-copy between pauses
+        if have_logo:
+            input_args += ["-i", logo_path]
+            filter_parts.append(f"[{next_input_idx}:v]scale={logo_w}:-1,format=rgba[lg]")
+            filter_parts.append(
+                f"[{final_stream}][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto[vlogo]"
+            )
+            final_stream = "vlogo"
+            next_input_idx += 1
+            logo_baked = True
+        # Keyframes at every insertion point make the Phase 2 cuts exact
+        key_times = [f"{p['t_ins'] - edge:.3f}" for p in overlay_plan if p["t_ins"] > 0.0]
+        kf_args = ["-force_key_frames", ",".join(key_times)] if key_times else []
+
+        # With no pauses to insert (the logo is baked here too), this pass is the final
+        # output; write it straight to out_path rather than to an intermediate to copy
+        base_labels = out_path if not overlay_times else str(Path(out_path).with_suffix(".pre_slates.mp4"))
         print("[apply_overlays] Compositing labels/icon (pre-slate) →", base_labels)
-        cmd = input_args + [
-            "-filter_complex", ";".join(filter_parts),
-            "-map", f"[{final_stream}]", "-map", "0:a?",
-            "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p",
-            "-c:a", "copy",
-            "-shortest",
-            base_labels
-        ]
-        run(cmd)
+        with filter_complex_args(filter_parts, Path(base_labels).with_suffix(".filters.txt")) as fc_args:
+            cmd = input_args + fc_args + [
+                "-map", f"[{final_stream}]", "-map", "0:a?",
+            ] + h264_args + ["-pix_fmt", "yuv420p"] + kf_args + [
+                "-c:a", "copy",
+            ] + (faststart if base_labels == out_path else []) + [
+                base_labels
+            ]
+            run(cmd)
         base_for_pause = base_labels
 
     # Phase 2: pause slate insertion (top-most layer)
     if not overlay_times:
-        if have_logo:
+        if have_logo and not logo_baked:
             print("[apply_overlays] No [OVERLAY] markers; applying permanent logo overlay → out")
             run([
                 "ffmpeg", "-y",
                 "-i", base_for_pause,
-                "-loop", "1", "-i", logo_path,
+                "-i", logo_path,
                 "-filter_complex", f"[1:v]scale={logo_w}:-1,format=rgba[lg];[0:v][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto[v]",
                 "-map", "[v]", "-map", "0:a?",
-                "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps)),
+            ] + h264_args + [
+                "-pix_fmt", "yuv420p", "-r", str(int(fps)),
                 "-c:a", "copy",
+            ] + faststart + [
                 out_path
             ])
-        else:
+        elif base_for_pause != out_path:
             print("[apply_overlays] No [OVERLAY] markers found or could not align; copying base → out")
-            run(["ffmpeg", "-y", "-i", base_for_pause, "-c", "copy", out_path])
+            run(["ffmpeg", "-y", "-i", base_for_pause, "-c", "copy"] + faststart + [out_path])
+        else:
+            print("[apply_overlays] No [OVERLAY] markers found or could not align; labels pass wrote out")
     else:
-        # Build segments
-        workdir = Path(tempfile.mkdtemp(prefix="overlays_"))
-        concat_list = workdir / "concat.txt"
-        seg_index = 0
-        t_cursor = 0.0
-        # Encode settings for uniformity across segments
-        v_enc = ["-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps))]
+        # Encode settings for the final output
+        v_enc = h264_args + ["-pix_fmt", "yuv420p", "-r", str(int(fps))]
         a_enc = ["-c:a", "aac", "-b:a", args.audio_bitrate, "-ar", "48000", "-ac", "2"]
 
-        def add_file_to_concat(p: Path):
-            with concat_list.open("a") as f:
-                f.write(f"file '{p.as_posix()}'\n")
-
-        print(f"[apply_overlays] Inserting {len(overlay_times)} overlay pause(s)")
-
-        # Prepare per-overlay config lookup
-        cfg_lookup = build_overlay_config_lookup(cfg)
-        for idx, t_overlay in enumerate(overlay_times):
-            ov_id = overlay_ids[idx] if idx < len(overlay_ids) else None
-            # Resolve per-overlay parameters
-            # Base defaults from global args
-            this_duration = float(args.duration)
-            this_fade = float(args.fade)
-            this_alpha = overlay_alpha
-            this_pre_roll = pre_roll_sec
-            # Apply config overrides if present
-            if ov_id is not None and ov_id in cfg_lookup.get("by_id", {}):
-                ov_cfg = cfg_lookup["by_id"][ov_id]
-            else:
-                ov_cfg = cfg_lookup.get("default", {})
-            if isinstance(ov_cfg, dict):
-                if "duration" in ov_cfg:
-                    try:
-                        this_duration = float(ov_cfg.get("duration"))
-                    except Exception:
-                        pass
-                if "fade" in ov_cfg:
-                    try:
-                        this_fade = float(ov_cfg.get("fade"))
-                    except Exception:
-                        pass
-                if "overlay_alpha" in ov_cfg:
-                    try:
-                        this_alpha = float(ov_cfg.get("overlay_alpha"))
-                    except Exception:
-                        pass
-                if "pre_roll_sec" in ov_cfg:
-                    try:
-                        this_pre_roll = float(ov_cfg.get("pre_roll_sec"))
-                    except Exception:
-                        pass
-                elif "pre_roll_frames" in ov_cfg:
-                    try:
-                        this_pre_roll = max(0, int(ov_cfg.get("pre_roll_frames"))) / float(fps or 24)
-                    except Exception:
-                        pass
-            # Choose image for this overlay
-            slate_img = find_overlay_image_for_id(
-                ov_id,
-                slate,
-                cfg_lookup,
-                cfg_path.parent if 'cfg_path' in locals() and cfg_path else None,
-                Path(args.script),
-                Path(args.base),
-            )
-            # Apply pre-roll (shift earlier)
-            t_ins = max(0.0, t_overlay - this_pre_roll)
-            # Enforce monotonic timeline
-            if t_ins < t_cursor:
-                t_ins = t_cursor
-            # Pre segment: [t_cursor, t_ins)
-            if t_ins > t_cursor:
-                seg_path = workdir / f"seg_{seg_index:03d}.mp4"
-                seg_index += 1
-                # Re-encode segment to unify parameters
-                if have_logo:
-                    seg_dur = max(0.0, t_ins - t_cursor)
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-ss", f"{t_cursor:.3f}",
-                        "-to", f"{t_ins:.3f}",
-                        "-i", base_for_pause,
-                        "-loop", "1", "-t", f"{seg_dur:.3f}", "-i", logo_path,
-                        "-filter_complex", f"[1:v]scale={logo_w}:-1,format=rgba[lg];[0:v][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):shortest=1:format=auto[vout]",
-                        "-map", "[vout]", "-map", "0:a?",
-                    ] + v_enc + a_enc + [str(seg_path)]
-                else:
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-ss", f"{t_cursor:.3f}",
-                        "-to", f"{t_ins:.3f}",
-                        "-i", base_for_pause,
-                    ] + v_enc + a_enc + [str(seg_path)]
-                run(cmd)
-                add_file_to_concat(seg_path)
-
-            # Pause segment: freeze exact frame at t_ins and overlay slate with fade, add silence audio
-            still = workdir / f"still_{idx:03d}.png"
-            cmd_still = [
-                "ffmpeg", "-y",
-                "-ss", f"{t_ins:.3f}",
-                "-i", base_for_pause,
-                "-frames:v", "1",
-                str(still),
+        # Optional countdown timer assets (TimerCircle + NumbersBold) shown during each pause
+        try:
+            scenes_dir = Path(args.script).parent / "scenes"
+            timer_circle_path = scenes_dir / "TimerCircle.png"
+            numbers_dir = scenes_dir / "NumbersBold"
+            digit_files = [numbers_dir / f"{d}.png" for d in range(10)]
+            # A NumbersBold.ttf can stand in for the digit PNGs
+            numbers_font = scenes_dir / "NumbersBold.ttf"
+            if not all(p.exists() for p in digit_files):
+                digit_files = []
+            timer_assets_ok = timer_circle_path.exists() and (bool(digit_files) or numbers_font.exists())
+        except Exception:
+            timer_assets_ok = False
+
+        def pause_inputs(item: dict[str, Any], with_logo: bool) -> list[str]:
+            # Inputs for one pause, in order: freeze source, slate, [prerendered timer], [logo]
+            # Input-level seek, and read only ~2 frames so the decoder stops right after the frozen one
+            args_ = [
+                "-ss", f"{max(0.0, item['t_ins'] - edge):.3f}", "-t", f"{2.0 / fps:.3f}", "-i", base_for_pause,
+                "-i", item["image"],
             ]
-            run(cmd_still)
-
-            pause_mp4 = workdir / f"pause_{idx:03d}.mp4"
-            st = 0.0
-            ft_in = st
+            if pause_has_timer(item):
+                args_ += ["-i", str(timer_cache[(item["duration"], item["fade"])])]
+            if with_logo:
+                args_ += ["-i", logo_path]
+            return args_
+
+        def pause_has_timer(item: dict[str, Any]) -> bool:
+            # Timer only when there is a dwell between fade-in and fade-out
+            return timer_assets_ok and max(0.0, item["duration"] - 2.0 * item["fade"]) > 0.0
+
+        def add_pause_filters(parts: list[str], item: dict[str, Any], first_idx: int, with_logo: bool, tag: str) -> str:
+            # Freeze the exact frame at t_ins and overlay the slate with fade; returns the video label
+            this_duration = item["duration"]
+            this_fade = item["fade"]
+            ft_in = 0.0
             ft_out = max(0.0, this_duration - this_fade)
-            if have_logo:
-                filter_complex = (
-                    f"[1:v]format=rgba,fade=in:st={ft_in}:d={this_fade}:alpha=1,"
-                    f"fade=out:st={ft_out}:d={this_fade}:alpha=1,"
-                    f"colorchannelmixer=aa={this_alpha}[sl];"
-                    f"[0:v][sl]overlay=x=0:y=0:shortest=1:format=auto[bg];"
-                    f"[3:v]scale={logo_w}:-1,format=rgba[lg];"
-                    f"[bg][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):shortest=1:format=auto[vout]"
+            # Hold the first decoded frame for the whole pause
+            hold_frames = max(1, int(round(this_duration * fps)))
+            parts.append(
+                f"[{first_idx}:v]trim=end_frame=1,loop=loop={hold_frames - 1}:size=1,"
+                f"setpts=N/{int(fps)}/TB[{tag}fz]"
+            )
+            parts.append(
+                f"[{first_idx + 1}:v]format=rgba,loop=loop={hold_frames - 1}:size=1,setpts=N/{int(fps)}/TB,"
+                f"fade=in:st={ft_in}:d={this_fade}:alpha=1,"
+                f"fade=out:st={ft_out}:d={this_fade}:alpha=1,"
+                f"colorchannelmixer=aa={item['alpha']}[{tag}sl]"
+            )
+            parts.append(f"[{tag}fz][{tag}sl]overlay=x=0:y=0:shortest=1:format=auto[{tag}pv]")
+            cur = f"{tag}pv"
+            next_idx = first_idx + 2
+            timer_idx = None
+            if pause_has_timer(item):
+                timer_idx = next_idx
+                next_idx += 1
+            # Logo sits above the slate, below the timer
+            if with_logo:
+                parts.append(f"[{next_idx}:v]scale={logo_w}:-1,format=rgba[{tag}lg]")
+                parts.append(
+                    f"[{cur}][{tag}lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto[{tag}pl]"
                 )
-                cmd_pause = [
-                    "ffmpeg", "-y",
-                    "-loop", "1", "-t", f"{this_duration:.3f}", "-i", str(still),
-                    "-loop", "1", "-t", f"{this_duration:.3f}", "-i", slate_img,
-                    "-f", "lavfi", "-t", f"{this_duration:.3f}", "-i", "anullsrc=channel_layout=stereo:sample_rate=48000",
-                    "-loop", "1", "-t", f"{pause_d:.3f}", "-i", logo_path,
-                    "-filter_complex", filter_complex,
-                    "-map", "[vout]", "-map", "2:a",
-                ] + v_enc + a_enc + [str(pause_mp4)]
-            else:
-                filter_complex = (
-                    f"[1:v]format=rgba,fade=in:st={ft_in}:d={this_fade}:alpha=1,"
-                    f"fade=out:st={ft_out}:d={this_fade}:alpha=1,"
-                    f"colorchannelmixer=aa={this_alpha}[sl];"
-                    f"[0:v][sl]overlay=x=0:y=0:shortest=1:format=auto[vout]"
+                cur = f"{tag}pl"
+            if timer_idx is not None:
+                # Composite in RGBA like the timer graph itself, so the clip's soft edges blend the same
+                parts.append(f"[{cur}]format=rgba[{tag}v0]")
+                parts.append(f"[{tag}v0][{timer_idx}:v]overlay=x={TIMER_X}:y={TIMER_Y}:format=auto[{tag}tm]")
+                cur = f"{tag}tm"
+            # Overlays can emit a frame past the main input's end; keep video exactly as long as the silence
+            parts.append(f"[{cur}]trim=end_frame={hold_frames}[{tag}pause]")
+            return f"{tag}pause"
+
+        def pause_input_count(item: dict[str, Any], with_logo: bool) -> int:
+            return 2 + (1 if pause_has_timer(item) else 0) + (1 if with_logo else 0)
+
+        # The countdown depends only on duration and fade: render each distinct pair once
+        # and overlay that clip on every pause using it (exact keys, since the digit
+        # windows shift with the duration)
+        timer_cache: dict[tuple[float, float], Path] = {}
+        timer_keys = sorted({(item["duration"], item["fade"]) for item in overlay_plan if pause_has_timer(item)})
+        if timer_keys:
+            timer_dir = Path(tempfile.mkdtemp(prefix="timer_"))
+            for i, (t_dur, t_fade) in enumerate(timer_keys):
+                timer_cache[(t_dur, t_fade)] = timer_dir / f"timer_{i}.mov"
+                render_timer_clip(
+                    timer_cache[(t_dur, t_fade)], timer_circle_path, digit_files, numbers_font, t_dur, t_fade, int(fps),
                 )
-                cmd_pause = [
-                    "ffmpeg", "-y",
-                    "-loop", "1", "-t", f"{this_duration:.3f}", "-i", str(still),
-                    "-loop", "1", "-t", f"{this_duration:.3f}", "-i", slate_img,
-                    "-f", "lavfi", "-t", f"{this_duration:.3f}", "-i", "anullsrc=channel_layout=stereo:sample_rate=48000",
-                    "-filter_complex", filter_complex,
-                    "-map", "[vout]", "-map", "2:a",
-                ] + v_enc + a_enc + [str(pause_mp4)]
-            run(cmd_pause)
-            # Optional: overlay countdown timer (TimerCircle + NumbersBold) during dwell (post fade-in to pre fade-out)
-            try:
-                scenes_dir = Path(args.script).parent / "scenes"
-                timer_circle_path = scenes_dir / "TimerCircle.png"
-                numbers_dir = scenes_dir / "NumbersBold"
-                digit_files = {str(d): numbers_dir / f"{d}.png" for d in range(10)}
-                assets_ok = timer_circle_path.exists() and all(p.exists() for p in digit_files.values())
-            except Exception:
-                assets_ok = False
-            # Compute dwell window
-            hold_seconds = max(0.0, float(this_duration) - 2.0 * float(this_fade))
-            show_timer = assets_ok and hold_seconds > 0.0
-            if show_timer:
-                # Number PNG dimensions (w,h) in px as provided
-                digit_size: dict[str, tuple[int,int]] = {
-                    "1": (58, 130),
-                    "2": (94, 132),
-                    "3": (99, 134),
-                    "4": (105, 130),
-                    "5": (97, 132),
-                    "6": (101, 134),
-                    "7": (92, 130),
-                    "8": (101, 134),
-                    "9": (101, 134),
-                    "0": (105, 134),
-                }
-                circle_src_w = 701
-                circle_src_h = 701
-                circle_w = 220
-                circle_h = 220
-                scale_factor = float(circle_w) / float(circle_src_w)
-                # Make digits 25% larger than the circle's scale
-                digit_scale_factor = scale_factor * 1.25
-                gap = 7
-                # Countdown windows:
-                # - Start showing first number at t=0 (during fade-in)
-                # - Show 0 starting 1s before fade-out starts, and keep 0 through fade-out to the end
-                zero_start = max(0.0, float(ft_out) - 1.0)
-                # Build 1-second windows ending at zero_start and going backward in 1s blocks, clipped at t=0
-                steps: list[tuple[float, float]] = []
-                t_end = float(zero_start)
-                while t_end > 0.0:
-                    t_start = max(0.0, t_end - 1.0)
-                    steps.insert(0, (t_start, t_end))
-                    if t_start <= 0.0:
-                        break
-                    t_end = t_start
-                # Build inputs: 0 = pause clip, 1 = timer circle, 2..11 = digits 0..9
-                input_args = [
-                    "ffmpeg", "-y",
-                    "-i", str(pause_mp4),
-                    "-loop", "1", "-t", f"{this_duration:.3f}", "-i", str(timer_circle_path),
-                ]
-                # Maintain deterministic order 0..9 for mapping
-                for d in range(10):
-                    input_args += ["-loop", "1", "-t", f"{this_duration:.3f}", "-i", str(digit_files[str(d)])]
-                # Start filter graph
-                filter_parts: list[str] = []
-                # Normalize base format
-                filter_parts.append("[0:v]format=rgba[v0]")
-                # Timer circle visible for entire pause (including fades); scale to 220x220
-                circle_enable = f"between(t,0,{float(this_duration):.3f})"
-                # Apply overlay-level fade to circle if fade > 0
-                if float(this_fade) > 0.0:
-                    filter_parts.append(
-                        f"[1:v]scale={circle_w}:{circle_h},format=rgba,"
-                        f"fade=t=in:st=0:d={float(this_fade):.3f}:alpha=1,"
-                        f"fade=t=out:st={float(ft_out):.3f}:d={float(this_fade):.3f}:alpha=1[tc]"
-                    )
+
+        # Phase 1 output carries keyframes at every insertion point; if its streams
+        # match what the pause clips are encoded with, the base can be stream-copied
+        seg_params = ffprobe_stream_params(base_for_pause) if base_for_pause != base else {}
+        seg_v = seg_params.get("video") or {}
+        seg_a = seg_params.get("audio") or {}
+        copy_segments = (
+            seg_v.get("codec_name") == "h264"
+            and seg_v.get("pix_fmt") == "yuv420p"
+            and seg_v.get("r_frame_rate") == f"{int(fps)}/1"
+            and bool(seg_v.get("time_base"))
+            and bool(seg_a.get("sample_rate")) and bool(seg_a.get("channels"))
+        )
+
+        print(f"[apply_overlays] Inserting {len(overlay_plan)} overlay pause(s)")
+        t_cursor = 0.0
+        if copy_segments:
+            # Stream-copy the base between pauses; only the pause clips are encoded,
+            # with the base's codec parameters so the concat demuxer can copy them
+            workdir = Path(tempfile.mkdtemp(prefix="overlays_"))
+            segments: list[Path] = []
+            timescale = seg_v["time_base"].split("/")[-1]
+            sample_rate = str(seg_a["sample_rate"])
+            channels = int(seg_a["channels"])
+            layout = "mono" if channels == 1 else "stereo"
+            # Pauses sharing an insertion point (markers pulled together by pre-roll or the
+            # monotonic clamp) play back to back on the same frozen frame: one clip per run
+            pause_groups: list[list[dict[str, Any]]] = []
+            for item in overlay_plan:
+                if pause_groups and pause_groups[-1][0]["t_ins"] == item["t_ins"]:
+                    pause_groups[-1].append(item)
                 else:
-                    filter_parts.append(f"[1:v]scale={circle_w}:{circle_h},format=rgba[tc]")
-                # Place circle 60px from left, 45px from bottom
-                circle_x = 60
-                # y uses main_h to keep relative to bottom
-                circle_y_expr = f"(main_h-{circle_h}-45)"
-                filter_parts.append(f"[v0][tc]overlay=x={circle_x}:y={circle_y_expr}:format=auto:enable='{circle_enable}'[vc]")
-                cur = "vc"
-                # Map digit char -> input index (2..11)
-                digit_input_idx = {str(d): (2 + d) for d in range(10)}
-                # Helper to compute positions per value string
-                def layout_for_value(val: int) -> list[tuple[str, int, str, int, int]]:
-                    s = str(max(0, int(val)))
-                    # Compute total width including gap
-                    scaled_widths = [int(round(digit_size[ch][0] * digit_scale_factor)) for ch in s]
-                    scaled_heights = [int(round(digit_size[ch][1] * digit_scale_factor)) for ch in s]
-                    total_w = sum(scaled_widths) + gap * (len(s) - 1 if len(s) > 1 else 0)
-                    x_left = circle_x + int((circle_w - total_w) / 2)
-                    # circle top y expression
-                    y_top_expr = f"(main_h-{circle_h}-45)"
-                    placements: list[tuple[str, int, str, int, int]] = []
-                    x_cursor = x_left
-                    for i, ch in enumerate(s):
-                        sw = scaled_widths[i]
-                        sh = scaled_heights[i]
-                        # y to vertically center this digit within the circle
-                        y_expr = f"({y_top_expr}+{int((circle_h - sh) / 2)})"
-                        placements.append((ch, x_cursor, y_expr, sw, sh))
-                        x_cursor += sw + gap
-                    return placements
-                # For each second window, overlay appropriate digits with quick crossfades
-                num_steps = len(steps)
-                for i, (start_t, end_t) in enumerate(steps):
-                    if end_t - start_t <= 0.0:
-                        continue
-                    # Value counts down to 1 for the last pre-zero window
-                    value = num_steps - i
-                    placements = layout_for_value(value)
-                    enable = f"between(t,{start_t:.3f},{end_t:.3f})"
-                    # Quick fade durations (0.1s each side, but clamp to half the window)
-                    win = float(end_t - start_t)
-                    fi = min(0.1, max(0.0, win / 2.0))
-                    fo = fi
-                    _overlay_seq_counter = 0
-                    for idx_p, (ch, x_pos, y_expr, sw, sh) in enumerate(placements):
-                        tag_in = cur
-                        tag_out = f"v_step{i}_{_overlay_seq_counter}"
-                        didx = digit_input_idx.get(ch, 2)  # default to '0' if somehow missing
-                        # Scale this digit instance to match circle scale, keep 7px gap unchanged
-                        dscaled = f"sd_step{i}_{_overlay_seq_counter}"
-                        # Build fade filters: global overlay-level fades (if any) + per-window quick crossfades
-                        if float(this_fade) > 0.0:
-                            if fi > 0.0 and fo > 0.0:
-                                filter_parts.append(
-                                    f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                    f"fade=t=in:st=0:d={float(this_fade):.3f}:alpha=1,"
-                                    f"fade=t=out:st={float(ft_out):.3f}:d={float(this_fade):.3f}:alpha=1,"
-                                    f"fade=t=in:st={start_t:.3f}:d={fi:.3f}:alpha=1,"
-                                    f"fade=t=out:st={(end_t - fo):.3f}:d={fo:.3f}:alpha=1[{dscaled}]"
-                                )
-                            else:
-                                filter_parts.append(
-                                    f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                    f"fade=t=in:st=0:d={float(this_fade):.3f}:alpha=1,"
-                                    f"fade=t=out:st={float(ft_out):.3f}:d={float(this_fade):.3f}:alpha=1[{dscaled}]"
-                                )
-                        else:
-                            if fi > 0.0 and fo > 0.0:
-                                filter_parts.append(
-                                    f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                    f"fade=t=in:st={start_t:.3f}:d={fi:.3f}:alpha=1,"
-                                    f"fade=t=out:st={(end_t - fo):.3f}:d={fo:.3f}:alpha=1[{dscaled}]"
-                                )
-                            else:
-                                filter_parts.append(f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba[{dscaled}]")
-                        filter_parts.append(f"[{tag_in}][{dscaled}]overlay=x={int(x_pos)}:y={y_expr}:format=auto:enable='{enable}'[{tag_out}]")
-                        cur = tag_out
-                        _overlay_seq_counter += 1
-                # Final zero: from 1s before fade-out starts, through fade-out until end
-                if float(this_duration) > 0.0:
-                    z_start = max(0.0, float(zero_start))
-                    z_end = float(this_duration)
-                    if z_end > z_start:
-                        placements = layout_for_value(0)
-                        enable = f"between(t,{z_start:.3f},{z_end:.3f})"
-                        _overlay_seq_counter = 0
-                        for idx_p, (ch, x_pos, y_expr, sw, sh) in enumerate(placements):
-                            tag_in = cur
-                            tag_out = f"v_zero_{_overlay_seq_counter}"
-                            didx = digit_input_idx.get(ch, 2)
-                            dscaled = f"sd_zero_{_overlay_seq_counter}"
-                            # Fade-in only (keep 0 visible through fade-out)
-                            fi0 = min(0.1, max(0.0, (z_end - z_start) / 2.0))
-                            if float(this_fade) > 0.0:
-                                if fi0 > 0.0:
-                                    filter_parts.append(
-                                        f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                        f"fade=t=in:st=0:d={float(this_fade):.3f}:alpha=1,"
-                                        f"fade=t=out:st={float(ft_out):.3f}:d={float(this_fade):.3f}:alpha=1,"
-                                        f"fade=t=in:st={z_start:.3f}:d={fi0:.3f}:alpha=1[{dscaled}]"
-                                    )
-                                else:
-                                    filter_parts.append(
-                                        f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                        f"fade=t=in:st=0:d={float(this_fade):.3f}:alpha=1,"
-                                        f"fade=t=out:st={float(ft_out):.3f}:d={float(this_fade):.3f}:alpha=1[{dscaled}]"
-                                    )
-                            else:
-                                if fi0 > 0.0:
-                                    filter_parts.append(
-                                        f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba,"
-                                        f"fade=t=in:st={z_start:.3f}:d={fi0:.3f}:alpha=1[{dscaled}]"
-                                    )
-                                else:
-                                    filter_parts.append(f"[{didx}:v]scale={int(sw)}:{int(sh)},format=rgba[{dscaled}]")
-                            filter_parts.append(f"[{tag_in}][{dscaled}]overlay=x={int(x_pos)}:y={y_expr}:format=auto:enable='{enable}'[{tag_out}]")
-                            cur = tag_out
-                            _overlay_seq_counter += 1
-                # Map video and preserve audio from original pause clip
-                pause_with_timer = Path(str(pause_mp4).replace(".mp4", "_timer.mp4"))
-                cmd_timer = input_args + [
-                    "-filter_complex", ";".join(filter_parts),
-                    "-map", f"[{cur}]", "-map", "0:a",
-                    "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps)),
-                    "-c:a", "aac", "-b:a", args.audio_bitrate,
-                    str(pause_with_timer)
-                ]
-                run(cmd_timer)
-                pause_mp4 = pause_with_timer
-            # Add final pause segment (with timer if applied)
-            add_file_to_concat(pause_mp4)
-
-            # Move cursor forward
-            t_cursor = t_ins
-
-        # Tail segment: from last cursor to end
-        tail_path = workdir / f"seg_{seg_index:03d}.mp4"
-        seg_index += 1
-        if have_logo:
-            cmd_tail = [
+                    pause_groups.append([item])
+            # Pause clips are independent short encodes: run them side by side, splitting
+            # the cores between them so the x264 instances don't oversubscribe the CPU
+            cpus = os.cpu_count() or 1
+            jobs = max(1, min(len(pause_groups), int(args.jobs or 0) or cpus // 2))
+            pause_v_enc = v_enc + ["-threads", str(max(1, cpus // jobs)), "-video_track_timescale", timescale]
+            pause_a_enc = ["-c:a", "aac", "-b:a", args.audio_bitrate, "-ar", sample_rate, "-ac", str(channels)]
+            # The frozen frame already carries the baked logo; put it back above the slate
+            with_logo = have_logo and logo_baked
+
+            # Split the base at every insertion keyframe in one stream-copy pass; the
+            # segment muxer cuts on the keyframe packet, so B-frames stay with their GOP
+            boundaries = sorted({item["t_ins"] for item in overlay_plan if item["t_ins"] > 0.0})
+
+            def split_base() -> None:
+                run([
+                    "ffmpeg", "-y", "-i", base_for_pause,
+                    "-map", "0:v", "-map", "0:a", "-c", "copy",
+                    "-f", "segment", "-segment_times", ",".join(f"{t - edge:.3f}" for t in boundaries),
+                    "-reset_timestamps", "1",
+                    str(workdir / "seg_%03d.mp4"),
+                ])
+
+            def build_pause_clip(idx: int, group: list[dict[str, Any]]) -> Path:
+                parts: list[str] = []
+                inputs: list[str] = []
+                vouts: list[str] = []
+                next_idx = 0
+                for j, item in enumerate(group):
+                    vouts.append(add_pause_filters(parts, item, next_idx, with_logo, f"p{idx}_{j}"))
+                    inputs += pause_inputs(item, with_logo)
+                    next_idx += pause_input_count(item, with_logo)
+                vout = vouts[0]
+                if len(vouts) > 1:
+                    parts.append("".join(f"[{v}]" for v in vouts) + f"concat=n={len(vouts)}:v=1:a=0[p{idx}v]")
+                    vout = f"p{idx}v"
+                pause_mp4 = workdir / f"pause_{idx:03d}.mp4"
+                with filter_complex_args(parts, workdir / f"filters_{idx:03d}.txt") as fc_args:
+                    run(["ffmpeg", "-y"] + inputs + [
+                        "-f", "lavfi", "-t", f"{sum(item['duration'] for item in group):.3f}",
+                        "-i", f"anullsrc=channel_layout={layout}:sample_rate={sample_rate}",
+                    ] + fc_args + [
+                        "-map", f"[{vout}]", "-map", f"{next_idx}:a",
+                    ] + pause_v_enc + pause_a_enc + [str(pause_mp4)])
+                return pause_mp4
+
+            with ThreadPoolExecutor(max_workers=jobs + (1 if boundaries else 0)) as pool:
+                split_done = pool.submit(split_base) if boundaries else None
+                pause_clips = list(pool.map(build_pause_clip, range(len(pause_groups)), pause_groups))
+                if split_done is not None:
+                    split_done.result()
+            if boundaries:
+                base_slices = iter(sorted(workdir.glob("seg_*.mp4")))
+            else:
+                base_slices = iter([Path(base_for_pause)])
+
+            def add_base_slice() -> None:
+                # An insertion at/after the end of the base has no slice to add
+                seg_path = next(base_slices, None)
+                if seg_path is not None:
+                    segments.append(seg_path)
+
+            for group, pause_mp4 in zip(pause_groups, pause_clips):
+                if group[0]["t_ins"] > t_cursor:
+                    add_base_slice()
+                segments.append(pause_mp4)
+                t_cursor = group[0]["t_ins"]
+            # Tail segment: from last cursor to end
+            add_base_slice()
+
+            # The ffconcat script goes straight to ffmpeg's stdin. Entries are absolute
+            # file: URLs, since there is no list file for relative paths to resolve against
+            ffconcat = "ffconcat version 1.0\n" + "".join(f"file 'file:{p.resolve().as_posix()}'\n" for p in segments)
+            print("[apply_overlays] Concatenating segments →", out_path)
+            run([
                 "ffmpeg", "-y",
-                "-ss", f"{t_cursor:.3f}",
-                "-i", base_for_pause,
-                "-loop", "1", "-i", logo_path,
-                "-filter_complex", f"[1:v]scale={logo_w}:-1,format=rgba[lg];[0:v][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):shortest=1:format=auto[vout]",
-                "-map", "[vout]", "-map", "0:a?",
-            ] + v_enc + a_enc + [str(tail_path)]
+                "-f", "concat", "-safe", "0", "-protocol_whitelist", "file,pipe",
+                "-i", "pipe:0",
+                "-c:v", "copy",
+                # Re-encode audio to eliminate AAC priming/timestamp discontinuities
+            ] + a_enc + faststart + [out_path], stdin_data=ffconcat.encode())
+            print("[apply_overlays] Done.")
         else:
-            cmd_tail = [
-                "ffmpeg", "-y",
-                "-ss", f"{t_cursor:.3f}",
-                    "-i", base_for_pause,
-            ] + v_enc + a_enc + [str(tail_path)]
-        run(cmd_tail)
-        add_file_to_concat(tail_path)
-
-        # Concat all with demuxer (streams are identical → copy)
-        print("[apply_overlays] Concatenating segments →", out_path)
-        run([
-            "ffmpeg", "-y",
-            "-f", "concat", "-safe", "0",
-            "-i", str(concat_list),
-            # Re-encode final output to eliminate AAC priming/timestamp discontinuities
-        ] + v_enc + a_enc + [out_path])
-        print("[apply_overlays] Done.")
+            # Build every segment in a single ffmpeg invocation: pre/tail segments are
+            # input-seeked slices of the base, each pause freezes the frame at its
+            # insertion point under the slate, and the concat filter joins them all.
+            # Per-segment normalization so the concat filter sees uniform streams
+            v_norm = f"fps={int(fps)},format=yuv420p,setsar=1"
+            a_norm = "aformat=sample_rates=48000:channel_layouts=stereo"
+            silence = f"anullsrc=channel_layout=stereo:sample_rate=48000,{a_norm}"
+            # Assume audio unless ffprobe saw the video stream but no audio stream
+            base_has_audio = base_audio_s is not None or base_video_s is None
+            # A logo baked in Phase 1 only needs restoring above each slate
+            pause_logo = have_logo and logo_baked
+
+            input_args = ["ffmpeg", "-y"]
+            next_input_idx = 0
+            filter_parts: list[str] = []
+            seg_index = 0
+
+            def add_base_segment(start: float, end: float | None) -> None:
+                # Slice [start, end) of the base (end=None → to the end of file)
+                nonlocal next_input_idx, seg_index
+                input_args.extend(["-ss", f"{max(0.0, start - edge):.3f}"])
+                if end is not None:
+                    input_args.extend(["-to", f"{end - edge:.3f}"])
+                input_args.extend(["-i", base_for_pause])
+                in_idx = next_input_idx
+                next_input_idx += 1
+                filter_parts.append(f"[{in_idx}:v]setpts=PTS-STARTPTS,{v_norm}[sv{seg_index}]")
+                if base_has_audio:
+                    filter_parts.append(f"[{in_idx}:a]asetpts=PTS-STARTPTS,{a_norm}[sa{seg_index}]")
+                else:
+                    seg_end = end if end is not None else float(base_video_s)
+                    filter_parts.append(f"{silence},atrim=duration={max(0.0, seg_end - start):.3f}[sa{seg_index}]")
+                seg_index += 1
+
+            for idx, item in enumerate(overlay_plan):
+                # Pre segment: [t_cursor, t_ins)
+                if item["t_ins"] > t_cursor:
+                    add_base_segment(t_cursor, item["t_ins"])
+                # Pause segment over silence
+                input_args += pause_inputs(item, pause_logo)
+                vout = add_pause_filters(filter_parts, item, next_input_idx, pause_logo, f"p{idx}")
+                next_input_idx += pause_input_count(item, pause_logo)
+                filter_parts.append(f"[{vout}]{v_norm}[sv{seg_index}]")
+                filter_parts.append(f"{silence},atrim=duration={item['duration']:.3f}[sa{seg_index}]")
+                seg_index += 1
+                # Move cursor forward
+                t_cursor = item["t_ins"]
+
+            # Tail segment: from last cursor to end
+            add_base_segment(t_cursor, None)
+
+            concat_inputs = "".join(f"[sv{i}][sa{i}]" for i in range(seg_index))
+            filter_parts.append(f"{concat_inputs}concat=n={seg_index}:v=1:a=1[vcat][acat]")
+            final_stream = "vcat"
+            # Permanent logo over the whole timeline (bottom-right, clear of the timer)
+            if have_logo and not logo_baked:
+                input_args += ["-i", logo_path]
+                filter_parts.append(f"[{next_input_idx}:v]scale={logo_w}:-1,format=rgba[lg]")
+                filter_parts.append(
+                    f"[vcat][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto[vout]"
+                )
+                final_stream = "vout"
+                next_input_idx += 1
+
+            print("[apply_overlays] Rendering segments and pauses in one pass →", out_path)
+            with filter_complex_args(filter_parts, Path(out_path).with_suffix(".filters.txt")) as fc_args:
+                run(input_args + fc_args + [
+                    "-map", f"[{final_stream}]", "-map", "[acat]",
+                ] + v_enc + a_enc + faststart + [out_path])
+            print("[apply_overlays] Done.")
 
     # Phase 3: optional intro sequence
     # New animated intro (intro2) takes precedence if present; otherwise fallback to legacy single-image intro.
@@ -1151,8 +1699,12 @@ def main():
         char_width = int(intro2_cfg.get("char_width", 620))
         intro_logo_scale = float(intro2_cfg.get("intro_logo_scale", 1.0))
 
+        # One pass over the script header for the conflict description and the role names
+        headers = extract_header_values(script_text, [
+            "CONFLICT DESCRIPTION:", "DISPUTANT 1 NAME:", "DISPUTANT 2 NAME:", "MEDIATOR A NAME:", "MEDIATOR B NAME:",
+        ])
         # Prepare conflict description text (prefixed)
-        conflict = extract_header_value(script_text, "CONFLICT DESCRIPTION:")
+        conflict = headers["CONFLICT DESCRIPTION:"]
         if not conflict:
             conflict = "Conflict description not found."
         conflict_prefixed = f"Conflict Description: {conflict}"
@@ -1256,11 +1808,69 @@ def main():
             computed_total = max(char_end, d_bubbles_end, m_bubbles_end, conflict_end, process_end) + tail_pad
             intro_total = round(computed_total, 3)
 
-        # Build inputs and filter graph
+        # Role labels: bubble + title + name per role
+        # Build name strings from the script headers read above; reuse first_name helper
+        d1_name = headers["DISPUTANT 1 NAME:"]
+        d2_name = headers["DISPUTANT 2 NAME:"]
+        ma_name = headers["MEDIATOR A NAME:"]
+        mb_name = headers["MEDIATOR B NAME:"]
+        def first_name(full: str) -> str:
+            full = (full or "").strip()
+            if not full:
+                return ""
+            return full.split()[0].title()
+        titles = ["Disputant 1", "Mediator A", "Mediator B", "Disputant 2"]
+        names = [first_name(d1_name) or "Unknown", first_name(ma_name) or "Unknown", first_name(mb_name) or "Unknown", first_name(d2_name) or "Unknown"]
+        title_size = 34
+        name_size = 23
+        line_spacing = 6
+        # Fonts (reuse labels font if provided)
+        if args.labels_fontfile:
+            provided_font = Path(args.labels_fontfile).resolve()
+            bold_font = provided_font
+            regular_font = provided_font
+        else:
+            default_inter = Path("/Library/Fonts/Inter.ttf")
+            bold_candidates = [
+                Path("/Library/Fonts/Inter Bold.ttf"),
+                Path("/Library/Fonts/Inter-Bold.ttf"),
+                Path("/System/Library/Fonts/Supplemental/Inter-Bold.ttf"),
+            ]
+            bold_font = next((p for p in bold_candidates if p.exists()), default_inter)
+            regular_font = default_inter
+        # The labels are static, so pre-render one still per role with Pillow and give each a
+        # single faded overlay; the bubble + two drawtext chain below is the fallback
+        role_labels: dict[int, tuple[Path, tuple[int, int]]] = {}
+        for ridx in sorted({c["idx"] for c in chars}):
+            role_png = tmp_dir / f"role_{ridx}.png"
+            role_xy = render_labels_png(
+                role_png, (tgt_w, tgt_h), [(cx_px[ridx], bottom_px[ridx], titles[ridx], names[ridx])],
+                str(Path(args.labels_bubble)) if args.labels_bubble else None, 289,
+                bold_font, regular_font, title_size, name_size, line_spacing,
+            )
+            if role_xy is None:
+                role_labels = {}
+                break
+            role_labels[ridx] = (role_png, role_xy)
+
+        # The conflict description is static too: pre-render it once when its font is known
+        conflict_png = tmp_dir / "conflict.png"
+        have_conflict_png = bool(args.intro_fontfile) and render_text_block_png(
+            conflict_png, intro_text_wrapped, str(Path(args.intro_fontfile)),
+            int(args.intro_fontsize), args.intro_fontcolor, 10,
+        )
+
+        # Build inputs and filter graph. Stills are read as a single frame and held
+        # in-graph, so each PNG is decoded once rather than on every intro frame.
+        intro_frames = max(1, int(round(intro_total * fps)))
+
+        def hold(frames: int) -> str:
+            return f"loop=loop={frames - 1}:size=1,setpts=N/{int(fps)}/TB"
+
         input_args = ["ffmpeg", "-y"]
         # 0: background (or solid color if absent)
         if intro_bg:
-            input_args += ["-loop", "1", "-framerate", str(int(fps)), "-t", f"{intro_total:.3f}", "-i", intro_bg]
+            input_args += ["-framerate", str(int(fps)), "-i", intro_bg]
             bg_tag = "0:v"
             next_idx = 1
         else:
@@ -1274,34 +1884,48 @@ def main():
         title_fade = float(intro2_cfg.get("title_fade", intro_fade))
         title_path = str(Path(intro2_cfg.get("title_slide"))) if intro2_cfg.get("title_slide") else ""
         if title_path and title_d > 0.0:
-            input_args += ["-loop", "1", "-framerate", str(int(fps)), "-t", f"{title_d:.3f}", "-i", title_path]
+            input_args += ["-framerate", str(int(fps)), "-i", title_path]
             title_tag = f"{next_idx}:v"
             next_idx += 1
-        # 1: optional bubble image (reused)
-        have_bubble = bool(args.labels_bubble)
+        # 1: optional bubble image (reused), or one pre-rendered label still per role
+        have_bubble = bool(args.labels_bubble) and not role_labels
+        role_label_idx: dict[int, int] = {}
+        for ridx, (role_png, _) in role_labels.items():
+            input_args += ["-i", str(role_png)]
+            role_label_idx[ridx] = next_idx
+            next_idx += 1
         if have_bubble:
-            input_args += ["-loop", "1", "-t", f"{intro_total:.3f}", "-i", str(Path(args.labels_bubble))]
+            input_args += ["-i", str(Path(args.labels_bubble))]
             bubble_idx = next_idx
             next_idx += 1
         else:
             bubble_idx = None
-        # Character inputs
+        # Character inputs: one per distinct image, shared by every character that uses it
         char_inputs = []
+        char_image_idx: dict[str, int] = {}
         for c in chars:
-            input_args += ["-loop", "1", "-t", f"{intro_total:.3f}", "-i", c["image"]]
-            c["input_idx"] = next_idx
+            if c["image"] not in char_image_idx:
+                input_args += ["-i", c["image"]]
+                char_image_idx[c["image"]] = next_idx
+                next_idx += 1
+            c["input_idx"] = char_image_idx[c["image"]]
             char_inputs.append(c)
+        # Conflict description still
+        conflict_idx = None
+        if have_conflict_png:
+            input_args += ["-i", str(conflict_png)]
+            conflict_idx = next_idx
             next_idx += 1
         # ProcessForm overlay
         pf_idx = None
         if process_overlay:
-            input_args += ["-loop", "1", "-t", f"{intro_total:.3f}", "-i", process_overlay]
+            input_args += ["-i", process_overlay]
             pf_idx = next_idx
             next_idx += 1
         # Optional logo overlay (match permanent logo position/size)
         logo_idx = None
         if have_logo:
-            input_args += ["-loop", "1", "-t", f"{intro_total:.3f}", "-i", logo_path]
+            input_args += ["-i", logo_path]
             logo_idx = next_idx
             next_idx += 1
         # Silent audio
@@ -1309,92 +1933,82 @@ def main():
         audio_input_idx = next_idx
 
         filter_parts = []
-        # Start by scaling/cropping bg to target and convert to rgba
+        # Start by scaling/cropping bg to target. The background has no alpha, so it stays
+        # yuv420p and every overlay=format=auto onto it blends in yuv420 rather than rgba
+        bg_hold = f",{hold(intro_frames)}" if intro_bg else ""
         filter_parts.append(
             f"[{bg_tag}]scale=w={tgt_w}:h={tgt_h}:force_original_aspect_ratio=increase,"
-            f"crop={tgt_w}:{tgt_h},format=rgba[vbg]"
+            f"crop={tgt_w}:{tgt_h},format=yuv420p{bg_hold}[vbg]"
         )
         # If title slide present, scale it and crossfade into background; else use background directly
         if title_tag:
+            # The slide is shown opaque (any alpha it carries is dropped), as xfade did
             filter_parts.append(
                 f"[{title_tag}]scale=w={tgt_w}:h={tgt_h}:force_original_aspect_ratio=increase,"
-                f"crop={tgt_w}:{tgt_h},format=rgba[vt]"
+                f"crop={tgt_w}:{tgt_h},format=rgb24,format=rgba,{hold(max(1, int(round(title_d * fps))))}[vt]"
             )
-            # Crossfade: title → bg, fade at end of title
+            # Crossfade: title → bg, fade at end of title. An alpha fade-out over the background
+            # is the same blend, and once the title ends the background passes straight through
             xf_off = max(0.0, title_d - title_fade)
             filter_parts.append(
-                f"[vt][vbg]xfade=transition=fade:duration={title_fade:.3f}:offset={xf_off:.3f}[v0]"
+                f"[vt]fade=t=out:st={xf_off:.3f}:d={title_fade:.3f}:alpha=1[vtf]"
             )
+            filter_parts.append("[vbg][vtf]overlay=x=0:y=0:format=auto:eof_action=pass[v0]")
             cur = "v0"
         else:
             cur = "vbg"
 
         # Prepare bubbles: scale and split
         if bubble_idx is not None:
-            filter_parts.append(f"[{bubble_idx}:v]scale=289:-1,format=rgba,split=4[nb1][nb2][nb3][nb4]")
+            filter_parts.append(f"[{bubble_idx}:v]scale=289:-1,format=rgba,{hold(intro_frames)},split=4[nb1][nb2][nb3][nb4]")
+
+        # Layer timings shared by every fade/enable below, formatted once
+        f_total = f"{intro_total:.3f}"
+        f_fade = f"{intro_fade:.3f}"
+
+        def fade_in(st: float) -> str:
+            # Layers start at their own appear time: trim drops the held frames before it,
+            # so fade and overlay never touch a layer that is not yet visible
+            return f"trim=start={st:.3f},fade=t=in:st={st:.3f}:d={f_fade}:alpha=1"
 
         # Overlay characters
         # placement == "camera": assume PNGs match camera framing; optionally scale to char_width and center-bottom align
         # placement == "slots": legacy fixed slots with char_width scaling
+        # Each distinct image is scaled and held once, then split to the characters using it
+        if placement == "camera":
+            # camera: scale to requested width (e.g., 1400), keep aspect; or full-frame when unset
+            char_prep = f"scale={int(char_width)}:-1,format=rgba" if int(char_width) > 0 else "format=rgba"
+        else:
+            char_prep = f"scale={char_width}:-1,format=rgba"
+        for ci in sorted(set(char_image_idx.values())):
+            users = [j for j, c in enumerate(char_inputs) if c["input_idx"] == ci]
+            fanout = f",split={len(users)}" if len(users) > 1 else ""
+            filter_parts.append(f"[{ci}:v]{char_prep},{hold(intro_frames)}{fanout}" + "".join(f"[ch{j}]" for j in users))
         for j, c in enumerate(char_inputs):
-            ci = c["input_idx"]
             start = max(0.0, float(c["appear"]))
             if placement == "camera":
                 if int(char_width) > 0:
-                    # Scale to requested width (e.g., 1400), keep aspect; center horizontally, bottom align
-                    filter_parts.append(f"[{ci}:v]scale={int(char_width)}:-1,format=rgba[ch{j}]")
+                    # Center horizontally, bottom align
                     # Fade in alpha on the character
-                    filter_parts.append(f"[ch{j}]fade=t=in:st={start:.3f}:d={intro_fade:.3f}:alpha=1[ch{j}f]")
+                    filter_parts.append(f"[ch{j}]{fade_in(start)}[ch{j}f]")
                     filter_parts.append(
-                        f"[{cur}][ch{j}f]overlay=x=(main_w-overlay_w)/2:y=(main_h-overlay_h):format=auto:enable='between(t,{start:.3f},{intro_total:.3f})'[v{j+1}]"
+                        f"[{cur}][ch{j}f]overlay=x=(main_w-overlay_w)/2:y=(main_h-overlay_h):format=auto:enable='between(t,{start:.3f},{f_total})'[v{j+1}]"
                     )
                 else:
                     # No scaling: overlay full-frame at 0,0
-                    filter_parts.append(f"[{ci}:v]format=rgba[ch{j}]")
-                    filter_parts.append(f"[ch{j}]fade=t=in:st={start:.3f}:d={intro_fade:.3f}:alpha=1[ch{j}f]")
+                    filter_parts.append(f"[ch{j}]{fade_in(start)}[ch{j}f]")
                     filter_parts.append(
-                        f"[{cur}][ch{j}f]overlay=x=0:y=0:format=auto:enable='between(t,{start:.3f},{intro_total:.3f})'[v{j+1}]"
+                        f"[{cur}][ch{j}f]overlay=x=0:y=0:format=auto:enable='between(t,{start:.3f},{f_total})'[v{j+1}]"
                     )
             else:
                 # slots placement
                 cx = cx_px[c["idx"]]
-                filter_parts.append(f"[{ci}:v]scale={char_width}:-1,format=rgba[ch{j}]")
-                filter_parts.append(f"[ch{j}]fade=t=in:st={start:.3f}:d={intro_fade:.3f}:alpha=1[ch{j}f]")
+                filter_parts.append(f"[ch{j}]{fade_in(start)}[ch{j}f]")
                 filter_parts.append(
-                    f"[{cur}][ch{j}f]overlay=x=({cx}-overlay_w/2):y=(main_h-overlay_h-150):format=auto:enable='between(t,{start:.3f},{intro_total:.3f})'[v{j+1}]"
+                    f"[{cur}][ch{j}f]overlay=x=({cx}-overlay_w/2):y=(main_h-overlay_h-150):format=auto:enable='between(t,{start:.3f},{f_total})'[v{j+1}]"
                 )
             cur = f"v{j+1}"
 
-        # Add bubbles + name text
-        # Build name strings from script header; reuse first_name helper
-        d1_name = extract_header_value(script_text, "DISPUTANT 1 NAME:")
-        d2_name = extract_header_value(script_text, "DISPUTANT 2 NAME:")
-        ma_name = extract_header_value(script_text, "MEDIATOR A NAME:")
-        mb_name = extract_header_value(script_text, "MEDIATOR B NAME:")
-        def first_name(full: str) -> str:
-            full = (full or "").strip()
-            if not full:
-                return ""
-            return full.split()[0].title()
-        titles = ["Disputant 1", "Mediator A", "Mediator B", "Disputant 2"]
-        names = [first_name(d1_name) or "Unknown", first_name(ma_name) or "Unknown", first_name(mb_name) or "Unknown", first_name(d2_name) or "Unknown"]
-        title_size = 34
-        name_size = 23
-        line_spacing = 6
-        # Fonts (reuse labels font if provided)
-        if args.labels_fontfile:
-            provided_font = Path(args.labels_fontfile).resolve()
-            bold_font = provided_font
-            regular_font = provided_font
-        else:
-            default_inter = Path("/Library/Fonts/Inter.ttf")
-            bold_candidates = [
-                Path("/Library/Fonts/Inter Bold.ttf"),
-                Path("/Library/Fonts/Inter-Bold.ttf"),
-                Path("/System/Library/Fonts/Supplemental/Inter-Bold.ttf"),
-            ]
-            bold_font = next((p for p in bold_candidates if p.exists()), default_inter)
-            regular_font = default_inter
         # For each role present, compute bubble start = char start + bubble_delay
         # We'll overlay bubble and draw two text lines (title/name)
         used_roles = {c["idx"]: c for c in char_inputs}
@@ -1404,13 +2018,21 @@ def main():
             # Per-role bubble delays (fall back to global bubble_delay)
             role_delay = d_bubbles_delay if ridx in (0, 3) else m_bubbles_delay
             start = max(0.0, float(used_roles[ridx]["appear"]) + role_delay)
+            if ridx in role_labels:
+                lx, ly = role_labels[ridx][1]
+                filter_parts.append(f"[{role_label_idx[ridx]}:v]format=rgba,{hold(intro_frames)},{fade_in(start)}[rl{ridx}]")
+                filter_parts.append(
+                    f"[{cur}][rl{ridx}]overlay=x={lx}:y={ly}:format=auto:enable='between(t,{start:.3f},{f_total})'[vo{ridx}]"
+                )
+                cur = f"vo{ridx}"
+                continue
             # bubble
             if bubble_idx is not None:
                 nb_tag = f"nb{ridx+1}"
                 # Fade in bubble before overlay
-                filter_parts.append(f"[{nb_tag}]fade=t=in:st={start:.3f}:d={intro_fade:.3f}:alpha=1[{nb_tag}f]")
+                filter_parts.append(f"[{nb_tag}]{fade_in(start)}[{nb_tag}f]")
                 filter_parts.append(
-                    f"[{cur}][{nb_tag}f]overlay=x=({cx_px[ridx]}-overlay_w/2):y=(main_h-{bottom_px[ridx]}-overlay_h):format=auto:enable='between(t,{start:.3f},{intro_total:.3f})'[vb{ridx}]"
+                    f"[{cur}][{nb_tag}f]overlay=x=({cx_px[ridx]}-overlay_w/2):y=(main_h-{bottom_px[ridx]}-overlay_h):format=auto:enable='between(t,{start:.3f},{f_total})'[vb{ridx}]"
                 )
                 cur = f"vb{ridx}"
             # title text
@@ -1422,7 +2044,7 @@ def main():
                 f"text='{titles[ridx]}'",
                 f"x=({cx_px[ridx]}-text_w/2)",
                 f"y={title_y}",
-                f"enable='between(t,{start:.3f},{intro_total:.3f})'",
+                f"enable='between(t,{start:.3f},{f_total})'",
             ])
             filter_parts.append(f"[{cur}]drawtext={draw_title}[vt{ridx}]")
             # name text
@@ -1434,32 +2056,38 @@ def main():
                 f"text='({names[ridx]})'",
                 f"x=({cx_px[ridx]}-text_w/2)",
                 f"y={name_y}",
-                f"enable='between(t,{start:.3f},{intro_total:.3f})'",
+                f"enable='between(t,{start:.3f},{f_total})'",
             ])
             filter_parts.append(f"[vt{ridx}]drawtext={draw_name}[vo{ridx}]")
             cur = f"vo{ridx}"
 
         # Conflict description (top center), appear then disappear
-        fontopt = []
-        if args.intro_fontfile:
-            fontopt = [f"fontfile='{str(Path(args.intro_fontfile))}'"]
-        drawtext_opts = ":".join([
-            *fontopt,
-            f"textfile='{str(txt_file)}'",
-            f"fontcolor={args.intro_fontcolor}",
-            f"fontsize={int(args.intro_fontsize)}",
-            "line_spacing=10",
-            "x=(w-text_w)/2",
-            "y=80",
-            f"enable='between(t,{conflict_start:.3f},{(conflict_start+conflict_duration):.3f})'",
-        ])
-        filter_parts.append(f"[{cur}]drawtext={drawtext_opts}[vconf]")
+        conflict_enable = f"enable='between(t,{conflict_start:.3f},{(conflict_start+conflict_duration):.3f})'"
+        if conflict_idx is not None:
+            filter_parts.append(
+                f"[{cur}][{conflict_idx}:v]overlay=x=(main_w-overlay_w)/2:y=80:format=auto:{conflict_enable}[vconf]"
+            )
+        else:
+            fontopt = []
+            if args.intro_fontfile:
+                fontopt = [f"fontfile='{str(Path(args.intro_fontfile))}'"]
+            drawtext_opts = ":".join([
+                *fontopt,
+                f"textfile='{str(txt_file)}'",
+                f"fontcolor={args.intro_fontcolor}",
+                f"fontsize={int(args.intro_fontsize)}",
+                "line_spacing=10",
+                "x=(w-text_w)/2",
+                "y=80",
+                conflict_enable,
+            ])
+            filter_parts.append(f"[{cur}]drawtext={drawtext_opts}[vconf]")
         cur = "vconf"
 
         # Process form overlay on top near end
         if pf_idx is not None:
             filter_parts.append(
-                f"[{pf_idx}:v]format=rgba,fade=t=in:st={process_time:.3f}:d={intro_fade:.3f}:alpha=1[pf]"
+                f"[{pf_idx}:v]format=rgba,{hold(intro_frames)},{fade_in(process_time)}[pf]"
             )
             filter_parts.append(
                 f"[{cur}][pf]overlay=x=0:y=0:format=auto:enable='between(t,{process_time:.3f},{min(intro_total, process_time+process_duration):.3f})'[vout]"
@@ -1470,40 +2098,38 @@ def main():
         if logo_idx is not None:
             scaled_logo_w = max(1, int(logo_w * max(0.05, intro_logo_scale)))
             filter_parts.append(
-                f"[{logo_idx}:v]scale={scaled_logo_w}:-1,format=rgba[lg]"
+                f"[{logo_idx}:v]scale={scaled_logo_w}:-1,format=rgba,{hold(intro_frames)}[lg]"
             )
             filter_parts.append(
-                f"[{cur}][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto:enable='between(t,0,{intro_total:.3f})'[vlogo]"
+                f"[{cur}][lg]overlay=x=(main_w-overlay_w-{logo_mx}):y=(main_h-overlay_h-{logo_my}):format=auto:enable='between(t,0,{f_total})'[vlogo]"
             )
             cur = "vlogo"
 
-        intro_mp4 = tmp_dir / "intro2.mp4"
-        cmd = input_args + [
-            "-filter_complex", ";".join(filter_parts),
-            "-map", f"[{cur}]", "-map", f"{audio_input_idx}:a",
-            "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps)),
-            "-c:a", "aac", "-b:a", args.audio_bitrate,
-            "-shortest",
-            str(intro_mp4)
-        ]
-        print("[apply_overlays] Building animated intro (intro2) →", intro_mp4)
-        run(cmd)
-
-        # Crossfade intro → main
+        # Build the intro and crossfade it into the main video in one encode: the main
+        # file is just another input, so the intro is never written out and decoded again
         xf_d = max(0.1, min(intro_fade, intro_total - 0.1))
-        tmp_joined = tmp_dir / "intro2_merged.mp4"
-        run([
-            "ffmpeg", "-y",
-            "-i", str(intro_mp4),
-            "-i", str(out_path),
-            "-filter_complex",
-            f"[0:v][1:v]xfade=transition=fade:duration={xf_d:.3f}:offset={max(0.0, intro_total - xf_d):.3f}[v];"
-            f"[0:a][1:a]acrossfade=d={xf_d:.3f}[a]",
-            "-map", "[v]", "-map", "[a]",
-            "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps)),
-            "-c:a", "aac", "-b:a", args.audio_bitrate,
-            str(tmp_joined)
-        ])
+        main_idx = audio_input_idx + 1
+        input_args += ["-i", str(out_path)]
+        # xfade needs matching formats and timebases on both sides
+        filter_parts.append(f"[{cur}]format=yuv420p,settb=AVTB[vi]")
+        filter_parts.append(f"[{main_idx}:v]format=yuv420p,settb=AVTB[vm]")
+        filter_parts.append(
+            f"[vi][vm]xfade=transition=fade:duration={xf_d:.3f}:offset={max(0.0, intro_total - xf_d):.3f}[vx]"
+        )
+        filter_parts.append(f"[{audio_input_idx}:a][{main_idx}:a]acrossfade=d={xf_d:.3f}[ax]")
+        # Written next to the output so the final replace is a rename, never a cross-device move
+        tmp_joined = Path(out_path).with_suffix(".intro_join.mp4")
+        print("[apply_overlays] Building animated intro (intro2) and crossfading into main →", out_path)
+        with filter_complex_args(filter_parts, tmp_dir / "filters.txt") as fc_args:
+            cmd = input_args + fc_args + [
+                "-map", "[vx]", "-map", "[ax]",
+            ] + h264_args + [
+                "-pix_fmt", "yuv420p", "-r", str(int(fps)),
+                "-c:a", "aac", "-b:a", args.audio_bitrate,
+            ] + faststart + [
+                str(tmp_joined)
+            ]
+            run(cmd)
         Path(tmp_joined).replace(out_path)
     elif args.intro_bg and len(args.intro_bg) >= 1:
         # Legacy single-image intro (existing behavior)
@@ -1554,22 +2180,25 @@ def main():
             "-f", "lavfi", "-t", f"{intro_d:.3f}", "-i", "anullsrc=channel_layout=stereo:sample_rate=48000",
             "-filter_complex", filter_intro,
             "-map", "[v1]", "-map", "1:a",
-            "-c:v", "libx264", "-crf", str(int(args.crf)), "-pix_fmt", "yuv420p", "-r", str(int(fps)),
+        ] + h264_args + [
+            "-pix_fmt", "yuv420p", "-r", str(int(fps)),
             "-c:a", "aac", "-b:a", args.audio_bitrate,
             "-shortest",
             str(intro_mp4)
         ])
         # Concat intro + current out_path without re-encode
-        main_after = Path(out_path)
+        # Absolute: the concat demuxer resolves relative entries against the list's directory
+        main_after = Path(out_path).resolve()
         concat_list = tmp_dir / "concat.txt"
         concat_list.write_text(f"file '{str(intro_mp4)}'\nfile '{str(main_after)}'\n")
         final_out = str(main_after)
-        tmp_joined = tmp_dir / "joined.mp4"
+        tmp_joined = Path(final_out).with_suffix(".intro_join.mp4")
         run([
             "ffmpeg", "-y",
             "-f", "concat", "-safe", "0",
             "-i", str(concat_list),
             "-c", "copy",
+        ] + faststart + [
             str(tmp_joined)
         ])
         Path(tmp_joined).replace(final_out)
@@ -1,5 +1,10 @@
+import argparse
 import json
+import os
 import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -18,66 +23,53 @@ TOP_COLOR_HEX_BY_ROLE = {
 def parse_args(default_base: Path) -> dict:
     argv = sys.argv
     args = argv[argv.index("--") + 1 :] if "--" in argv else []
-    opts = {
-        "config": str(default_base / "manifests" / "generator_inputs.json"),
-        "scene": None,
-        "save": False,
-        "save_as": None,
-        "dry_run": False,
-        "trace": False,
-        "hdri_path": None,
-        "hdri_strength": None,
-        "hdri_from_config": None,
+    ap = argparse.ArgumentParser(allow_abbrev=False)
+    ap.add_argument("--config", default=str(default_base / "manifests" / "generator_inputs.json"))
+    ap.add_argument("--scene")
+    ap.add_argument("--save", action="store_true")
+    ap.add_argument("--save-as")
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--trace", action="store_true")
+    ap.add_argument("--hdri_path")
+    ap.add_argument("--hdri_strength")
+    ap.add_argument("--hdri_from_config")
+    ap.add_argument("--scene-list")
+    # Unknown arguments are ignored, as Blender may forward extra ones
+    ns, _ = ap.parse_known_args(args)
+
+    def resolved(p: Optional[str]) -> Optional[str]:
+        return str(Path(p).expanduser().resolve()) if p else None
+
+    try:
+        hdri_strength = float(ns.hdri_strength) if ns.hdri_strength is not None else None
+    except ValueError:
+        hdri_strength = None
+    return {
+        "config": resolved(ns.config),
+        "scene": resolved(ns.scene),
+        "save": ns.save,
+        "save_as": resolved(ns.save_as),
+        "dry_run": ns.dry_run,
+        "trace": ns.trace,
+        "hdri_path": str(Path(ns.hdri_path).expanduser()) if ns.hdri_path else None,
+        "hdri_strength": hdri_strength,
+        "hdri_from_config": resolved(ns.hdri_from_config),
+        "scene_list": resolved(ns.scene_list),
     }
-    i = 0
-    while i < len(args):
-        a = args[i]
-        if a == "--config" and i + 1 < len(args):
-            opts["config"] = str(Path(args[i + 1]).expanduser().resolve())
-            i += 2
-            continue
-        if a == "--scene" and i + 1 < len(args):
-            opts["scene"] = str(Path(args[i + 1]).expanduser().resolve())
-            i += 2
-            continue
-        if a == "--save":
-            opts["save"] = True
-            i += 1
-            continue
-        if a == "--save-as" and i + 1 < len(args):
-            opts["save_as"] = str(Path(args[i + 1]).expanduser().resolve())
-            i += 2
-            continue
-        if a == "--dry-run":
-            opts["dry_run"] = True
-            i += 1
-            continue
-        if a == "--trace":
-            opts["trace"] = True
-            i += 1
-            continue
-        if a == "--hdri_path" and i + 1 < len(args):
-            opts["hdri_path"] = str(Path(args[i + 1]).expanduser())
-            i += 2
-            continue
-        if a == "--hdri_strength" and i + 1 < len(args):
-            try:
-                opts["hdri_strength"] = float(args[i + 1])
-            except Exception:
-                opts["hdri_strength"] = None
-            i += 2
-            continue
-        if a == "--hdri_from_config" and i + 1 < len(args):
-            opts["hdri_from_config"] = str(Path(args[i + 1]).expanduser().resolve())
-            i += 2
-            continue
-        i += 1
-    return opts
+
+
+# Parsed JSON configs keyed by (path, mtime_ns); callers only read them, so one parse is shared
+_CONFIG_CACHE: Dict[Tuple[str, int], dict] = {}
 
 
 def load_config(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    key = (str(path), os.stat(path).st_mtime_ns)
+    cfg = _CONFIG_CACHE.get(key)
+    if cfg is None:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+        _CONFIG_CACHE[key] = cfg
+    return cfg
 
 
 def role_prefix_map(cfg: dict) -> Dict[str, str]:
@@ -88,31 +80,38 @@ def try_resolve_missing_files(search_dir: Path) -> None:
     """Resolve missing external images (e.g., HDRI) after the scene has been copied to a new location."""
     try:
         import bpy
-        # Try Blender's built-in resolver over the project root
-        bpy.ops.file.find_missing_files(directory=str(search_dir), recursive=True)
-        if TRACE:
-            print(f"[TRACE] find_missing_files in: {search_dir}")
+        # Only unpacked images whose file is gone need remapping; usually there are none
+        missing = {}
+        for img in list(bpy.data.images):
+            fp = getattr(img, "filepath", "") or ""
+            if not fp or getattr(img, "packed_file", None):
+                continue
+            if Path(bpy.path.abspath(fp)).exists():
+                continue
+            missing.setdefault(Path(bpy.path.basename(fp)).name, []).append(img)
+        if not missing:
+            return
+        # One walk over the project root, stopping once every missing name is found
+        found: Dict[str, Path] = {}
+        for dirpath, _dirnames, filenames in os.walk(search_dir):
+            for fn in filenames:
+                if fn in missing and fn not in found:
+                    found[fn] = Path(dirpath) / fn
+            if len(found) == len(missing):
+                break
+        for name, imgs in missing.items():
+            candidate = found.get(name)
+            if candidate is None:
+                continue
+            for img in imgs:
+                try:
+                    img.filepath = str(candidate)
+                    if TRACE:
+                        print(f"[TRACE] Remapped image '{img.name}' -> {candidate}")
+                except Exception:
+                    pass
     except Exception:
-        # Fallback: try to make paths absolute based on search_dir
-        try:
-            for img in list(bpy.data.images):
-                fp = getattr(img, "filepath", "") or ""
-                if not fp:
-                    continue
-                p = Path(fp)
-                if p.exists():
-                    continue
-                # If path is relative to the copied .blend, try resolving from project root
-                candidate = (search_dir / p.name)
-                if candidate.exists():
-                    try:
-                        img.filepath = str(candidate)
-                        if TRACE:
-                            print(f"[TRACE] Remapped image '{img.name}' -> {candidate}")
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+        pass
 
 
 def apply_hdri_environment(hdri_path: Path, strength: float = 0.7) -> None:
@@ -169,10 +168,10 @@ def apply_hdri_environment(hdri_path: Path, strength: float = 0.7) -> None:
                 links.new(a.outputs[a_sock], b.inputs[b_sock])
             except Exception:
                 pass
-        # Clear existing links to World Output
+        # Clear existing links to World Output (only the links on its own inputs)
         try:
-            for l in list(links):
-                if l.to_node == out:
+            for inp in out.inputs:
+                for l in list(inp.links):
                     links.remove(l)
         except Exception:
             pass
@@ -193,12 +192,59 @@ def ensure_scene(scene_path: Optional[str]) -> None:
     if scene_path:
         bpy.ops.wm.open_mainfile(filepath=scene_path)
 
-def set_collections_visible_for_render(root_col: bpy.types.Collection) -> None:
-    """Ensure the given collection tree is visible for both viewport and render, across all view layers."""
-    if not root_col:
+@dataclass
+class CollectionIndex:
+    """One walk over a collection subtree: its objects by name and its collections in pre-order."""
+    objects: Dict[str, bpy.types.Object]
+    # (lowercased name, object) pairs sorted by name, for bisecting on prefixes;
+    # a list, since names may differ only by case
+    objects_lower: List[Tuple[str, bpy.types.Object]]
+    collections: List[bpy.types.Collection]
+    # (lowercased name, collection) pairs in the same pre-order as collections
+    collections_lower: List[Tuple[str, bpy.types.Collection]]
+    # _find_collection_in_subtree results by lowercased name base
+    collection_hits: Dict[str, Optional[bpy.types.Collection]] = field(default_factory=dict)
+
+
+def index_collection(root: bpy.types.Collection) -> CollectionIndex:
+    """Walk root's subtree once (root first, children in order) and index it for the role helpers."""
+    objects: Dict[str, bpy.types.Object] = {}
+    collections: List[bpy.types.Collection] = []
+    stack = [root]
+    while stack:
+        col = stack.pop()
+        collections.append(col)
+        for o in col.objects:
+            objects.setdefault(o.name, o)
+        # Reversed so children pop in their listed order
+        stack.extend(list(col.children)[::-1])
+    objects_lower = sorted(((name.lower(), o) for name, o in objects.items()), key=lambda p: p[0])
+    collections_lower = [(c.name.lower(), c) for c in collections]
+    return CollectionIndex(
+        objects=objects,
+        objects_lower=objects_lower,
+        collections=collections,
+        collections_lower=collections_lower,
+    )
+
+
+def index_layer_collections(root: bpy.types.LayerCollection) -> Dict[int, List[bpy.types.LayerCollection]]:
+    """Map collection pointer -> its layer collections (a collection linked twice appears twice)."""
+    out: Dict[int, List[bpy.types.LayerCollection]] = {}
+    stack = [root]
+    while stack:
+        layer_col = stack.pop()
+        out.setdefault(layer_col.collection.as_pointer(), []).append(layer_col)
+        stack.extend(layer_col.children)
+    return out
+
+
+def set_collections_visible_for_render(index: CollectionIndex, dry: bool) -> None:
+    """Ensure the indexed collection tree is visible for both viewport and render, across all view layers."""
+    if not index.collections or dry:
         return
     # Set flags on the data collections
-    def mark(col: bpy.types.Collection):
+    for col in index.collections:
         try:
             col.hide_render = False
         except Exception:
@@ -207,94 +253,101 @@ def set_collections_visible_for_render(root_col: bpy.types.Collection) -> None:
             col.hide_viewport = False
         except Exception:
             pass
-        for c in col.children:
-            mark(c)
-    mark(root_col)
 
-    # Clear excludes in all view layers
-    def reveal_in_layer(layer_col, target: bpy.types.Collection):
-        if layer_col.collection == target:
+    # Clear excludes in all view layers: one walk of each layer tree, then a lookup per collection
+    for vl in bpy.context.scene.view_layers:
+        layer_cols = index_layer_collections(vl.layer_collection)
+        for col in index.collections:
+            for layer_col in layer_cols.get(col.as_pointer(), ()):
+                try:
+                    layer_col.exclude = False
+                    layer_col.holdout = False
+                    layer_col.indirect_only = False
+                except Exception:
+                    pass
+
+
+def _bulk_set_object_flag(col: bpy.types.Collection, attr: str, value: bool) -> None:
+    """Set a boolean object property on all of a collection's own objects in one foreach_set call."""
+    objs = col.objects
+    try:
+        objs.foreach_set(attr, [value] * len(objs))
+    except Exception:
+        for o in objs:
             try:
-                layer_col.exclude = False
-                layer_col.holdout = False
-                layer_col.indirect_only = False
+                setattr(o, attr, value)
             except Exception:
                 pass
-        for ch in layer_col.children:
-            reveal_in_layer(ch, target)
 
-    for vl in bpy.context.scene.view_layers:
-        # Walk entire subtree and reveal each collection node in layer tree
-        def walk_and_reveal(col: bpy.types.Collection):
-            reveal_in_layer(vl.layer_collection, col)
-            for ch in col.children:
-                walk_and_reveal(ch)
-        walk_and_reveal(root_col)
 
+def set_index_visibility(index: CollectionIndex, hidden: bool, dry: bool) -> None:
+    """Hide or show every object of an indexed subtree: render and viewport flags per collection in bulk."""
+    if TRACE:
+        for obj in index.objects.values():
+            print(f"[TRACE] hide_render {hidden}: {obj.name}")
+    if dry:
+        return
+    for col in index.collections:
+        _bulk_set_object_flag(col, "hide_render", hidden)
+        # Also hide in viewport and disable in viewports
+        _bulk_set_object_flag(col, "hide_viewport", hidden)
+    # hide_set is per view layer and has no bulk form
+    for obj in index.objects.values():
+        try:
+            obj.hide_set(hidden)
+        except Exception:
+            pass
 
-def iter_collection_objects(col: bpy.types.Collection):
-    for o in col.objects:
-        yield o
-    for c in col.children:
-        yield from iter_collection_objects(c)
 
+def set_all_hidden(index: CollectionIndex, dry: bool) -> None:
+    set_index_visibility(index, True, dry)
 
-def set_all_hidden(col: bpy.types.Collection, dry: bool) -> None:
-    for obj in iter_collection_objects(col):
-        if TRACE:
-            print(f"[TRACE] hide_render True: {obj.name}")
-        if not dry:
-            obj.hide_render = True
-            # Also hide in viewport and disable in viewports
-            try:
-                obj.hide_viewport = True
-            except Exception:
-                pass
-            try:
-                obj.hide_set(True)
-            except Exception:
-                pass
 
+def find_objects_by_prefix(index: CollectionIndex, prefix: str) -> Dict[str, bpy.types.Object]:
+    if not prefix:
+        return index.objects
+    return {n: o for n, o in index.objects.items() if n.startswith(prefix)}
 
-def find_objects_by_prefix(col: bpy.types.Collection, prefix: str) -> Dict[str, bpy.types.Object]:
-    result = {}
-    for obj in iter_collection_objects(col):
-        result[obj.name] = obj
-    return result
+def find_objects_by_lower_prefix(index: CollectionIndex, prefix_l: str) -> List[bpy.types.Object]:
+    """Objects whose lowercased name starts with prefix_l, found by bisecting the sorted objects_lower."""
+    pairs = index.objects_lower
+    i = bisect_left(pairs, prefix_l, key=lambda p: p[0])
+    found: List[bpy.types.Object] = []
+    while i < len(pairs) and pairs[i][0].startswith(prefix_l):
+        found.append(pairs[i][1])
+        i += 1
+    return found
 
-def _find_collection_in_subtree(root: bpy.types.Collection, name_base: str) -> Optional[bpy.types.Collection]:
-    """Find a collection whose name equals name_base or name_base.### within root's subtree."""
+def _find_collection_in_subtree(index: CollectionIndex, name_base: str) -> Optional[bpy.types.Collection]:
+    """Find a collection whose name equals name_base or name_base.### within the indexed subtree."""
     name_l = name_base.lower()
-    def match(n: str) -> bool:
-        nl = n.lower()
-        return nl == name_l or nl.startswith(name_l + ".")
-    def walk(c: bpy.types.Collection):
-        if match(c.name):
-            return c
-        for ch in c.children:
-            hit = walk(ch)
-            if hit:
-                return hit
-        return None
-    return walk(root)
-
-def set_collection_visible_recursive(coll: Optional[bpy.types.Collection], dry: bool) -> None:
-    if not coll:
+    if name_l in index.collection_hits:
+        return index.collection_hits[name_l]
+    dotted = name_l + "."
+    hit = None
+    for nl, c in index.collections_lower:
+        if nl == name_l or nl.startswith(dotted):
+            hit = c
+            break
+    index.collection_hits[name_l] = hit
+    return hit
+
+def set_collection_visible_recursive(coll_index: Optional[CollectionIndex], dry: bool) -> None:
+    if not coll_index:
         return
-    for o in iter_collection_objects(coll):
-        set_visible(o, dry)
+    set_index_visibility(coll_index, False, dry)
 
-def _first_object_with_materials(coll: Optional[bpy.types.Collection]) -> Optional[bpy.types.Object]:
-    if not coll:
+def _first_object_with_materials(coll_index: Optional[CollectionIndex]) -> Optional[bpy.types.Object]:
+    if not coll_index:
         return None
-    for o in iter_collection_objects(coll):
+    for o in coll_index.objects.values():
         try:
             if getattr(o, "material_slots", None) and len(o.material_slots) > 0:
                 return o
         except Exception:
             pass
     # fallback: any object
-    for o in iter_collection_objects(coll):
+    for o in coll_index.objects.values():
         return o
     return None
 
@@ -318,6 +371,28 @@ def pick_best_match(name_base: str, objects_by_name: Dict[str, bpy.types.Object]
     return objects_by_name[candidates[0][1]]
 
 
+def pick_best_match_any(name_bases: Tuple[str, ...], objects_by_name: Dict[str, bpy.types.Object]) -> Optional[bpy.types.Object]:
+    # Same preference as pick_best_match applied to each base in order, using one scan for all suffixes
+    dots = tuple(b + "." for b in name_bases)
+    best: List[Optional[Tuple[int, str]]] = [None] * len(name_bases)
+    for n in objects_by_name.keys():
+        if not n.startswith(dots):
+            continue
+        try:
+            num = int(n.split(".")[-1])
+        except Exception:
+            continue
+        for i, dot in enumerate(dots):
+            if n.startswith(dot) and (best[i] is None or (num, n) < best[i]):
+                best[i] = (num, n)
+    for name_base, cand in zip(name_bases, best):
+        if name_base in objects_by_name:
+            return objects_by_name[name_base]
+        if cand is not None:
+            return objects_by_name[cand[1]]
+    return None
+
+
 def set_visible(obj: Optional[bpy.types.Object], dry: bool) -> None:
     if not obj:
         return
@@ -336,19 +411,23 @@ def set_visible(obj: Optional[bpy.types.Object], dry: bool) -> None:
             pass
 
 
+def _srgb_to_linear(c: float) -> float:
+    # Convert sRGB [0..1] → linear
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+# Linear value for each 8-bit sRGB channel value
+_SRGB_TO_LINEAR = tuple(_srgb_to_linear(i / 255.0) for i in range(256))
+
+
+@lru_cache(maxsize=64)
 def hex_to_rgba(hex_str: str) -> Tuple[float, float, float, float]:
     s = hex_str.strip().lstrip("#")
     if len(s) != 6:
         return (1.0, 1.0, 1.0, 1.0)
-    def srgb_to_linear(c: float) -> float:
-        # Convert sRGB [0..1] → linear
-        return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
-    r_s = int(s[0:2], 16) / 255.0
-    g_s = int(s[2:4], 16) / 255.0
-    b_s = int(s[4:6], 16) / 255.0
-    r = srgb_to_linear(r_s)
-    g = srgb_to_linear(g_s)
-    b = srgb_to_linear(b_s)
+    r = _SRGB_TO_LINEAR[int(s[0:2], 16)]
+    g = _SRGB_TO_LINEAR[int(s[2:4], 16)]
+    b = _SRGB_TO_LINEAR[int(s[4:6], 16)]
     return (r, g, b, 1.0)
 
 
@@ -383,23 +462,26 @@ def set_object_material_color(obj: Optional[bpy.types.Object], base_names: Tuple
     if not obj:
         return
     rgba = hex_to_rgba(hex_color)
-    if dry and not TRACE:
-        return
     # Try to find a material on this object that starts with any of base_names
     names_with_prefix = tuple(f"{prefix}{n}" for n in base_names)
+    candidates = tuple(n.lower() for n in (names_with_prefix + base_names))
+    if dry:
+        # Read-only: report the material that would be recolored, write nothing
+        if TRACE:
+            mats = [slot.material for slot in obj.material_slots if slot.material]
+            target = next((m for m in mats if m.name.lower().startswith(candidates)), mats[0] if mats else None)
+            if target:
+                print(f"[DRY] Set material '{target.name}' color {rgba} on {obj.name}")
+        return
     for slot in obj.material_slots:
         mat = slot.material
         if not mat:
             continue
-        lname = mat.name.lower()
-        candidates = tuple(n.lower() for n in (names_with_prefix + base_names))
-        if any(lname.startswith(n) for n in candidates):
+        if mat.name.lower().startswith(candidates):
             # Ensure nodes exist
             if hasattr(mat, "use_nodes"):
                 mat.use_nodes = True
             if apply_rgba_to_material(mat, rgba):
-                if dry:
-                    print(f"[DRY] Set material '{mat.name}' color {rgba} on {obj.name}")
                 return
     # Fallback: first principled anywhere
     for slot in obj.material_slots:
@@ -410,13 +492,9 @@ def set_object_material_color(obj: Optional[bpy.types.Object], base_names: Tuple
             mat.use_nodes = True
         if mat.node_tree:
             if apply_rgba_to_material(mat, rgba):
-                if dry:
-                    print(f"[DRY] Set first Principled material '{mat.name}' color {rgba} on {obj.name}")
                 return
         try:
             mat.diffuse_color = rgba
-            if dry:
-                print(f"[DRY] Set diffuse color on '{mat.name}' to {rgba} for {obj.name}")
             return
         except Exception:
             pass
@@ -432,9 +510,36 @@ def set_object_all_principled_color(obj: Optional[bpy.types.Object], hex_color:
             continue
         if dry:
             print(f"[DRY] Set top color {rgba} on material '{mat.name}' (slot {idx}) for {obj.name}")
-            # still run setter in dry to verify sockets exist (no write will occur inside apply helper)
+            continue
         apply_rgba_to_material(mat, rgba)
 
+# Classified shader nodes per material pointer; pointers are only valid until the
+# next open_mainfile, so configure_scene clears this for every scene
+_MAT_NODES: Dict[int, Tuple[list, list, list, list]] = {}
+
+
+def _classify_material_nodes(mat: bpy.types.Material, nt) -> Tuple[list, list, list, list]:
+    """Return (all nodes, principled, hair, rgb) for mat, classified in one pass and cached."""
+    key = mat.as_pointer()
+    classes = _MAT_NODES.get(key)
+    if classes is not None:
+        return classes
+    nodes = list(nt.nodes)
+    principled, hair, rgb_nodes = [], [], []
+    for node in nodes:
+        idname = getattr(node, "bl_idname", "")
+        ntype = node.type
+        if idname == "ShaderNodeBsdfPrincipled" or ntype == "BSDF_PRINCIPLED":
+            principled.append(node)
+        elif idname in ("ShaderNodeBsdfHair", "ShaderNodeBsdfHairPrincipled") or ntype in ("BSDF_HAIR",):
+            hair.append(node)
+        elif idname == "ShaderNodeRGB" or ntype == "RGB":
+            rgb_nodes.append(node)
+    classes = (nodes, principled, hair, rgb_nodes)
+    _MAT_NODES[key] = classes
+    return classes
+
+
 def apply_rgba_to_material(mat: bpy.types.Material, rgba: Tuple[float, float, float, float]) -> bool:
     """Set color robustly on a material: disconnect inputs and set Base Color/Color."""
     if not mat:
@@ -454,9 +559,8 @@ def apply_rgba_to_material(mat: bpy.types.Material, rgba: Tuple[float, float, fl
     def set_on_socket(sock):
         try:
             if sock.is_linked:
-                for link in list(nt.links):
-                    if link.to_socket == sock:
-                        nt.links.remove(link)
+                for link in list(sock.links):
+                    nt.links.remove(link)
         except Exception:
             pass
         try:
@@ -465,41 +569,41 @@ def apply_rgba_to_material(mat: bpy.types.Material, rgba: Tuple[float, float, fl
         except Exception:
             return False
 
+    # Nodes classified once per material, then tried in priority order
+    nodes, principled, hair, rgb_nodes = _classify_material_nodes(mat, nt)
+
     # Principled BSDF
     changed_any = False
-    for node in nt.nodes:
-        if getattr(node, "bl_idname", "") == "ShaderNodeBsdfPrincipled" or node.type == "BSDF_PRINCIPLED":
-            base = node.inputs.get("Base Color")
-            if base and set_on_socket(base):
-                changed_any = True
-            subsurf = node.inputs.get("Subsurface Color")
-            if subsurf and set_on_socket(subsurf):
-                changed_any = True
+    for node in principled:
+        base = node.inputs.get("Base Color")
+        if base and set_on_socket(base):
+            changed_any = True
+        subsurf = node.inputs.get("Subsurface Color")
+        if subsurf and set_on_socket(subsurf):
+            changed_any = True
     if changed_any:
         return True
 
     # Hair BSDF / Principled Hair
-    for node in nt.nodes:
-        if getattr(node, "bl_idname", "") in ("ShaderNodeBsdfHair", "ShaderNodeBsdfHairPrincipled") or node.type in ("BSDF_HAIR",):
-            sock = node.inputs.get("Color")
-            if sock and set_on_socket(sock):
-                return True
+    for node in hair:
+        sock = node.inputs.get("Color")
+        if sock and set_on_socket(sock):
+            return True
 
     # Any node with Base Color or Color
-    for node in nt.nodes:
+    for node in nodes:
         for key in ("Base Color", "Color"):
             sock = node.inputs.get(key)
             if sock and set_on_socket(sock):
                 return True
 
     # RGB node fallback
-    for node in nt.nodes:
-        if getattr(node, "bl_idname", "") == "ShaderNodeRGB" or node.type == "RGB":
-            try:
-                node.outputs[0].default_value = rgba
-                return True
-            except Exception:
-                pass
+    for node in rgb_nodes:
+        try:
+            node.outputs[0].default_value = rgba
+            return True
+        except Exception:
+            pass
 
     try:
         mat.diffuse_color = rgba
@@ -550,13 +654,13 @@ def iter_slots_matching_base(obj: Optional[bpy.types.Object], prefix: str, base_
         return
     targets = (f"{prefix}{base_name}", base_name)
     targets_l = tuple(t.lower() for t in targets)
+    dotted_l = tuple(f"{t}." for t in targets_l)
     for i, slot in enumerate(obj.material_slots):
         mat = slot.material
         if not mat:
             continue
-        name = mat.name
-        lname = name.lower()
-        if any(lname == t or lname.startswith(f"{t}.") for t in targets_l):
+        lname = mat.name.lower()
+        if lname in targets_l or lname.startswith(dotted_l):
             yield i, slot
 
 def debug_print_body_materials(body: Optional[bpy.types.Object], dry: bool) -> None:
@@ -617,6 +721,44 @@ def get_or_create_simple_skin_material(name: str, rgba: Tuple[float, float, floa
             pass
     return mat
 
+
+@dataclass(frozen=True)
+class RoleBases:
+    """Object name bases a role looks up, for one (prefix, gender) pair."""
+    eyes: str
+    nose: str
+    # (primary, fallback): geo_body.001 is preferred over geo_body, likewise for teeth
+    body: Tuple[str, str]
+    teeth: Tuple[str, str]
+    basement: str
+    # Lowercased str.startswith tuple for the opposite-gender eyes/nose
+    other_parts: Tuple[str, str]
+
+
+# Built once per (prefix, gender_key) and reused across roles and scenes
+_ROLE_BASES: Dict[Tuple[str, str], RoleBases] = {}
+
+
+def role_name_bases(prefix: str, gender_key: str) -> RoleBases:
+    key = (prefix, gender_key)
+    bases = _ROLE_BASES.get(key)
+    if bases is None:
+        other_gender = "boy" if gender_key == "girl" else "girl"
+        bases = RoleBases(
+            eyes=f"{prefix}geo_{gender_key}_eyes",
+            nose=f"{prefix}geo_{gender_key}_nose",
+            body=(f"{prefix}geo_body.001", f"{prefix}geo_body"),
+            teeth=(f"{prefix}geo_teeth.001", f"{prefix}geo_teeth"),
+            basement=f"{prefix}0. hair_basement - {gender_key}",
+            other_parts=(
+                f"{prefix}geo_{other_gender}_eyes".lower(),
+                f"{prefix}geo_{other_gender}_nose".lower(),
+            ),
+        )
+        _ROLE_BASES[key] = bases
+    return bases
+
+
 def configure_role(role: str, cfg: dict, dry: bool) -> None:
     rp = role_prefix_map(cfg)
     prefix = rp.get(role, "")
@@ -631,32 +773,27 @@ def configure_role(role: str, cfg: dict, dry: bool) -> None:
         print(f"[WARN] Role collection '{role}' not found in scene; skipping.")
         return
 
+    # Walk the role collection tree once; every lookup below reads from this index
+    index = index_collection(root_col)
+
     # Make sure the whole role collection tree is visible for render/viewport
-    set_collections_visible_for_render(root_col)
+    set_collections_visible_for_render(index, dry)
 
     # Hide all then re-enable chosen
-    set_all_hidden(root_col, dry)
-    objs_by_name = find_objects_by_prefix(root_col, prefix)
+    set_all_hidden(index, dry)
+    objs_by_name = find_objects_by_prefix(index, prefix)
 
     # Core objects by gender
     gender_key = "girl" if gender == "F" else "boy"
-    eyes_base = f"{prefix}geo_{gender_key}_eyes"
-    nose_base = f"{prefix}geo_{gender_key}_nose"
-    # Prefer geo_body.001 over geo_body
-    body_base_primary = f"{prefix}geo_body.001"
-    body_base_fallback = f"{prefix}geo_body"
-    # Prefer geo_teeth.001 over geo_teeth
-    teeth_base_primary = f"{prefix}geo_teeth.001"
-    teeth_base_fallback = f"{prefix}geo_teeth"
-
-    eyes = pick_best_match(eyes_base, objs_by_name)
-    nose = pick_best_match(nose_base, objs_by_name)
-    body = pick_best_match(body_base_primary, objs_by_name) or pick_best_match(body_base_fallback, objs_by_name)
-    teeth = pick_best_match(teeth_base_primary, objs_by_name) or pick_best_match(teeth_base_fallback, objs_by_name)
+    bases = role_name_bases(prefix, gender_key)
+
+    eyes = pick_best_match(bases.eyes, objs_by_name)
+    nose = pick_best_match(bases.nose, objs_by_name)
+    body = pick_best_match_any(bases.body, objs_by_name)
+    teeth = pick_best_match_any(bases.teeth, objs_by_name)
 
     # Also show hair basement helper object: "{prefix}0. hair_basement - {gender_key}"
-    basement_base = f"{prefix}0. hair_basement - {gender_key}"
-    basement = pick_best_match(basement_base, objs_by_name)
+    basement = pick_best_match(bases.basement, objs_by_name)
 
     set_visible(eyes, dry)
     set_visible(nose, dry)
@@ -666,14 +803,10 @@ def configure_role(role: str, cfg: dict, dry: bool) -> None:
 
     # Explicitly ensure opposite-gender eyes/nose remain hidden (defensive)
     try:
-        other_gender = "boy" if gender_key == "girl" else "girl"
-        other_eyes = f"{prefix}geo_{other_gender}_eyes".lower()
-        other_nose = f"{prefix}geo_{other_gender}_nose".lower()
-        for name, obj in list(objs_by_name.items()):
-            ln = name.lower()
-            if ln.startswith(other_eyes) or ln.startswith(other_nose):
+        for part in bases.other_parts:
+            for obj in find_objects_by_lower_prefix(index, part):
                 if TRACE:
-                    print(f"[TRACE] ensure hidden: {name}")
+                    print(f"[TRACE] ensure hidden: {obj.name}")
                 if not dry:
                     try:
                         obj.hide_render = True
@@ -700,13 +833,14 @@ def configure_role(role: str, cfg: dict, dry: bool) -> None:
                 shirt_obj = obj
         else:
             # Try collection match if object not found
-            coll = _find_collection_in_subtree(root_col, target)
+            coll = _find_collection_in_subtree(index, target)
             if coll:
-                set_collection_visible_recursive(coll, dry)
+                coll_index = index_collection(coll)
+                set_collection_visible_recursive(coll_index, dry)
                 if key == "hair" and hair_obj is None:
-                    hair_obj = _first_object_with_materials(coll)
+                    hair_obj = _first_object_with_materials(coll_index)
                 if key == "shirt" and shirt_obj is None:
-                    shirt_obj = _first_object_with_materials(coll)
+                    shirt_obj = _first_object_with_materials(coll_index)
             else:
                 if TRACE or dry:
                     print(f"[WARN] Selector '{key}' target not found: {target}")
@@ -724,6 +858,8 @@ def configure_role(role: str, cfg: dict, dry: bool) -> None:
             continue
         if dry:
             print(f"[DRY] Set skin material color {rgba} on '{mat.name}' (object {body.name})")
+            any_changed = True
+            continue
         if apply_rgba_to_material(mat, rgba):
             any_changed = True
     if not any_changed:
@@ -741,14 +877,10 @@ def configure_role(role: str, cfg: dict, dry: bool) -> None:
         set_object_all_principled_color(shirt_obj, top_hex, dry)
 
 
-def main():
-    base_dir = Path(__file__).resolve().parents[1]
-    opts = parse_args(base_dir)
-    global TRACE
-    TRACE = bool(opts.get("trace"))
-    cfg = load_config(opts["config"])
-
+def configure_scene(opts: dict, cfg: dict, base_dir: Path) -> None:
+    """Open one scene, set up its World/HDRI, configure every role in cfg and save per opts."""
     ensure_scene(opts["scene"])
+    _MAT_NODES.clear()
     # World/HDRI setup from config (preferred), else attempt to resolve missing files
     try:
         # Priority: explicit CLI -> external config file -> generator_inputs.json run section
@@ -756,8 +888,7 @@ def main():
         hdri_strength = opts.get("hdri_strength")
         if not hdri_path_raw and opts.get("hdri_from_config"):
             try:
-                with open(opts["hdri_from_config"], "r", encoding="utf-8") as f:
-                    _hc = json.load(f)
+                _hc = load_config(opts["hdri_from_config"])
                 hdri_path_raw = _hc.get("hdri_path") or hdri_path_raw
                 if hdri_strength is None and "hdri_strength" in _hc:
                     hdri_strength = float(_hc.get("hdri_strength"))
@@ -780,7 +911,7 @@ def main():
             if hdri_path.exists():
                 apply_hdri_environment(hdri_path, hdri_strength)
             else:
-                print(f"[WARN] Configured HDRI not found: {hdri_path}. Falling back to find_missing_files.")
+                print(f"[WARN] Configured HDRI not found: {hdri_path}. Falling back to resolving missing images.")
                 try_resolve_missing_files(base_dir)
         else:
             try_resolve_missing_files(base_dir)
@@ -806,7 +937,31 @@ def main():
             print("[WARN] No scene path; use --save-as to specify a destination.")
 
 
-if __name__ == "__main__":
-    main()
+def main():
+    base_dir = Path(__file__).resolve().parents[1]
+    opts = parse_args(base_dir)
+    global TRACE
+    TRACE = bool(opts.get("trace"))
+
+    if not opts["scene_list"]:
+        configure_scene(opts, load_config(opts["config"]), base_dir)
+        return
 
+    # Batch mode: many scenes in one Blender session, saving one Blender startup per scene.
+    # Each entry is {"scene": ..., "save_as"?: ..., "config"?: ...}; other options apply to all
+    # (--save saves entries without their own save_as in place).
+    # open_mainfile replaces the whole session, so nothing carries over between scenes
+    # except the parsed configs in _CONFIG_CACHE (_MAT_NODES is cleared per scene).
+    for entry in load_config(opts["scene_list"]):
+        scene_opts = dict(opts)
+        scene_opts["scene"] = str(Path(entry["scene"]).expanduser().resolve())
+        # --save-as names a single file, so in batch mode it only comes from the entry
+        scene_opts["save_as"] = str(Path(entry["save_as"]).expanduser().resolve()) if entry.get("save_as") else None
+        if entry.get("config"):
+            scene_opts["config"] = str(Path(entry["config"]).expanduser().resolve())
+        print(f"[SCENE] {scene_opts['scene']}")
+        configure_scene(scene_opts, load_config(scene_opts["config"]), base_dir)
 
+
+if __name__ == "__main__":
+    main()